@@ -0,0 +1,282 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+A Cython version of back.check_win and a simpler version of hex_numba's
+alpha-beta search, for when neither the C++ module nor numba is available.
+Build with: python setup_fallback.py build_ext --inplace (from backend/)
+"""
+from libc.string cimport memset
+
+# Board sizes are limited by the a-z column labels
+MAX_SIZE = 26
+
+cdef enum:
+    MAX_CELLS = 26 * 26
+
+cdef int DIRECTION_ROWS[6]
+cdef int DIRECTION_COLS[6]
+DIRECTION_ROWS[:] = [-1, -1, 0, 0, 1, 1]
+DIRECTION_COLS[:] = [0, 1, -1, 1, -1, 0]
+
+
+cpdef bint check_win_c(const unsigned char[::1] cells, int size, int player) except -1:
+    """
+    Checks if player has a winning path on a flat row-major board of
+    size * size cells (e.g. bytes(chain.from_iterable(board))).
+    Player 1 (Blue): Connects top to bottom
+    Player 2 (Red): Connects left to right
+    """
+    cdef int stack[MAX_CELLS]
+    cdef unsigned char visited[MAX_CELLS]
+    cdef int top = 0
+    cdef int k, idx, row, col, d, nr, nc, nidx
+
+    if size < 1 or size > MAX_SIZE or cells.shape[0] != size * size:
+        raise ValueError("Board size mismatch")
+
+    with nogil:
+        memset(visited, 0, size * size)
+
+        # Seed the stack with the player's stones on the starting edge
+        for k in range(size):
+            idx = k if player == 1 else k * size
+            if cells[idx] == player:
+                visited[idx] = 1
+                stack[top] = idx
+                top += 1
+
+        # Depth-first flood-fill until the opposite edge is reached
+        while top > 0:
+            top -= 1
+            idx = stack[top]
+            row = idx // size
+            col = idx - row * size
+            if (player == 1 and row == size - 1) or (player != 1 and col == size - 1):
+                return True
+
+            for d in range(6):
+                nr = row + DIRECTION_ROWS[d]
+                nc = col + DIRECTION_COLS[d]
+                if 0 <= nr < size and 0 <= nc < size:
+                    nidx = nr * size + nc
+                    if cells[nidx] == player and not visited[nidx]:
+                        visited[nidx] = 1
+                        stack[top] = nidx
+                        top += 1
+
+    return False
+
+
+# Score sentinel, same as hex_numba.INF
+cdef enum:
+    INF = 1 << 30
+
+
+cdef bint _check_win_flat(const unsigned char* board, int size, int player,
+                          unsigned char* visited, int* stack) noexcept nogil:
+    """Flood-fill from the player's starting edge, as in check_win_c."""
+    cdef int top = 0
+    cdef int k, idx, row, col, d, nr, nc, nidx
+
+    memset(visited, 0, size * size)
+    for k in range(size):
+        idx = k if player == 1 else k * size
+        if board[idx] == player:
+            visited[idx] = 1
+            stack[top] = idx
+            top += 1
+
+    while top > 0:
+        top -= 1
+        idx = stack[top]
+        row = idx // size
+        col = idx - row * size
+        if (player == 1 and row == size - 1) or (player != 1 and col == size - 1):
+            return True
+
+        for d in range(6):
+            nr = row + DIRECTION_ROWS[d]
+            nc = col + DIRECTION_COLS[d]
+            if 0 <= nr < size and 0 <= nc < size:
+                nidx = nr * size + nc
+                if board[nidx] == player and not visited[nidx]:
+                    visited[nidx] = 1
+                    stack[top] = nidx
+                    top += 1
+
+    return False
+
+
+cdef bint _move_wins(const unsigned char* board, int size, int idx, int player,
+                     unsigned char* visited, int* stack) noexcept nogil:
+    """Checks whether the player's last move at idx joins both of their edges."""
+    cdef int top = 1
+    cdef int cell, row, col, edge_pos, d, nr, nc, nidx
+    cdef bint touches_start = False
+    cdef bint touches_goal = False
+
+    memset(visited, 0, size * size)
+    visited[idx] = 1
+    stack[0] = idx
+
+    while top > 0:
+        top -= 1
+        cell = stack[top]
+        row = cell // size
+        col = cell - row * size
+        edge_pos = row if player == 1 else col
+        if edge_pos == 0:
+            touches_start = True
+        if edge_pos == size - 1:
+            touches_goal = True
+        if touches_start and touches_goal:
+            return True
+
+        for d in range(6):
+            nr = row + DIRECTION_ROWS[d]
+            nc = col + DIRECTION_COLS[d]
+            if 0 <= nr < size and 0 <= nc < size:
+                nidx = nr * size + nc
+                if board[nidx] == player and not visited[nidx]:
+                    visited[nidx] = 1
+                    stack[top] = nidx
+                    top += 1
+
+    return False
+
+
+cdef int _stone_score(const unsigned char* board, int size, int player) noexcept nogil:
+    """One point per stone plus two for each stone on the player's goal edges."""
+    cdef int score = 0
+    cdef int idx, edge_pos
+
+    for idx in range(size * size):
+        if board[idx] == player:
+            score += 1
+            edge_pos = idx // size if player == 1 else idx % size
+            if edge_pos == 0 or edge_pos == size - 1:
+                score += 2
+    return score
+
+
+cdef int _win_score(const unsigned char* board, int size) noexcept nogil:
+    """Score of a won position for the winner: 1000 plus the empty cells left, as in hex_numba."""
+    cdef int score = 1000
+    cdef int idx
+    for idx in range(size * size):
+        if board[idx] == 0:
+            score += 1
+    return score
+
+
+cdef int _evaluate_flat(const unsigned char* board, int size, int player,
+                        unsigned char* visited, int* stack) noexcept nogil:
+    """Flat-board equivalent of back.evaluate for the given player (wins scored by _win_score)."""
+    cdef int opponent = 3 - player
+    if _check_win_flat(board, size, player, visited, stack):
+        return _win_score(board, size)
+    if _check_win_flat(board, size, opponent, visited, stack):
+        return -_win_score(board, size)
+    return _stone_score(board, size, player) - _stone_score(board, size, opponent)
+
+
+cdef int _alpha_beta_flat(unsigned char* board, int size, const int* order, int depth,
+                          int alpha, int beta, bint is_maximizing_player, int current_player,
+                          int last_move, unsigned char* visited, int* stack,
+                          int* best_move_out) noexcept nogil:
+    """
+    Alpha-beta search over the flat board, undoing moves in place. It scores
+    leaves like hex_numba._alpha_beta_flat (for the maximizing player) but
+    has no transposition table or iterative deepening, so the two can choose
+    different moves. Returns the score and stores the index of the best move
+    (or -1) in best_move_out.
+    """
+    cdef int opponent = 3 - current_player
+    cdef int sign = 1 if is_maximizing_player else -1  # Turns side-to-move scores into the maximizer's
+    cdef int best_score = -INF if is_maximizing_player else INF
+    cdef int best_move = -1
+    cdef int k, idx, eval_score, child_move
+
+    best_move_out[0] = -1
+
+    # Terminal conditions
+    if last_move < 0:
+        if (depth == 0 or _check_win_flat(board, size, 1, visited, stack)
+                or _check_win_flat(board, size, 2, visited, stack)):
+            return sign * _evaluate_flat(board, size, current_player, visited, stack)
+    else:
+        # Nobody had won before the last move, so only its group can hold a new win
+        if _move_wins(board, size, last_move, opponent, visited, stack):
+            return -sign * _win_score(board, size)
+        if depth == 0:
+            return sign * (_stone_score(board, size, current_player)
+                           - _stone_score(board, size, opponent))
+
+    # Moves are tried in precomputed center-first order
+    for k in range(size * size):
+        idx = order[k]
+        if board[idx] != 0:
+            continue
+
+        board[idx] = current_player
+        eval_score = _alpha_beta_flat(board, size, order, depth - 1, alpha, beta,
+                                      not is_maximizing_player, opponent, idx,
+                                      visited, stack, &child_move)
+        board[idx] = 0  # Undo move
+
+        if is_maximizing_player:
+            if eval_score > best_score:
+                best_score = eval_score
+                best_move = idx
+            if eval_score > alpha:
+                alpha = eval_score
+        else:
+            if eval_score < best_score:
+                best_score = eval_score
+                best_move = idx
+            if eval_score < beta:
+                beta = eval_score
+        if beta <= alpha:
+            break  # Cutoff
+
+    # No valid moves left
+    if best_move == -1:
+        return sign * _evaluate_flat(board, size, current_player, visited, stack)
+
+    best_move_out[0] = best_move
+    return best_score
+
+
+cpdef object find_move_c(const unsigned char[::1] cells, int size, int depth,
+                         bint is_maximizing_player, int current_player):
+    """
+    Runs the alpha-beta search on a flat row-major board (as for check_win_c)
+    and returns the best move as (row, col), or None if there is none.
+    """
+    cdef unsigned char board[MAX_CELLS]
+    cdef unsigned char visited[MAX_CELLS]
+    cdef int stack[MAX_CELLS]
+    cdef int order[MAX_CELLS]
+    cdef int center, distance, idx, n = 0
+    cdef int best_move = -1
+
+    if size < 1 or size > MAX_SIZE or cells.shape[0] != size * size:
+        raise ValueError("Board size mismatch")
+
+    with nogil:
+        for idx in range(size * size):
+            board[idx] = cells[idx]
+
+        # Cells by Manhattan distance to the center, row-major on ties
+        center = size // 2
+        for distance in range(2 * size):
+            for idx in range(size * size):
+                if abs(idx // size - center) + abs(idx % size - center) == distance:
+                    order[n] = idx
+                    n += 1
+
+        _alpha_beta_flat(board, size, order, depth, -INF, INF, is_maximizing_player,
+                         current_player, -1, visited, stack, &best_move)
+
+    if best_move < 0:
+        return None
+    return divmod(best_move, size)
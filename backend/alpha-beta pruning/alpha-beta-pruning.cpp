@@ -13,49 +13,109 @@
 #include <functional>
 #include <string>
 #include <cmath>
+#include <cstdint>
+#include <deque>
+#include <memory>
 
 namespace py = pybind11;
 
 // Player enum represents the state of a cell on the board
 enum Player { EMPTY = 0, PLAYER1 = 1, PLAYER2 = 2 };
 
-// Hash function for the board state to use in transposition table
-struct BoardHash {
-    std::size_t operator()(const std::vector<std::vector<int>>& board) const {
-        std::size_t seed = board.size();
-        for (const auto& row : board) {
-            for (int cell : row) {
-                seed ^= cell + 0x9e3779b9 + (seed << 6) + (seed >> 2);
-            }
-        }
-        return seed;
-    }
-};
+// Zobrist key of a player's stone on cell index row*size+col (splitmix64 of the
+// size/cell/player triple, so no table is needed for any board size). The board
+// size is mixed in because the transposition table outlives a board, and the same
+// cell index means a different cell on another size.
+inline uint64_t zobristKey(int size, int cell, Player player) {
+    uint64_t z = (static_cast<uint64_t>(size) << 32) + static_cast<uint64_t>(cell) * 2 + player;
+    z += 0x9e3779b97f4a7c15ULL;
+    z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ULL;
+    z = (z ^ (z >> 27)) * 0x94d049bb133111ebULL;
+    return z ^ (z >> 31);
+}
 
 // Transposition table entry to cache search results
 struct TTEntry {
-    int depth;      // Depth of the search
-    int value;      // Evaluation value
-    int flag;       // Flag for the type of node (0=exact, 1=lower bound, 2=upper bound)
+    uint64_t key;         // Zobrist hash of the position
+    int32_t value;        // Evaluation value
+    int8_t depth;         // Depth of the search
+    uint8_t flag;         // Flag for the type of node (0=exact, 1=lower bound, 2=upper bound)
+    uint16_t generation;  // Search the entry belongs to (0 = never written)
+};
+
+// Fixed-size, direct-mapped transposition table indexed by the low bits of the
+// Zobrist hash. Entries are replaced when they come from an older search or were
+// searched no deeper than the new result. Clearing only bumps the generation.
+class TranspositionTable {
+public:
+    static const size_t SIZE = size_t(1) << 18;
+    
+    TranspositionTable() : entries(SIZE), generation(1) {}
+    
+    const TTEntry* probe(uint64_t key) const {
+        const TTEntry& entry = entries[key & (SIZE - 1)];
+        return (entry.generation == generation && entry.key == key) ? &entry : nullptr;
+    }
+    
+    void store(uint64_t key, int depth, int value, int flag) {
+        TTEntry& entry = entries[key & (SIZE - 1)];
+        if (entry.generation != generation || entry.key == key || depth >= entry.depth) {
+            entry = {key, value, static_cast<int8_t>(depth), static_cast<uint8_t>(flag), generation};
+        }
+    }
+    
+    void clear() {
+        if (++generation == 0) {
+            // Generation counter wrapped: forget every entry for real
+            std::fill(entries.begin(), entries.end(), TTEntry{});
+            generation = 1;
+        }
+    }
+    
+private:
+    std::vector<TTEntry> entries;
+    uint16_t generation;
 };
 
-// Global transposition table to cache search results for positions already evaluated
-std::unordered_map<std::vector<std::vector<int>>, TTEntry, BoardHash> transpositionTable;
+// Transposition table to cache search results for positions already evaluated
+// (one per thread, so root moves can be searched in parallel)
+thread_local TranspositionTable transpositionTable;
 
 class HexBoard {
 private:
     int size;
     std::vector<std::vector<Player>> board;
     
-    // Union-Find data structures need to accommodate 4 virtual nodes
+    // On-board neighbors (row, col) of every cell, indexed by row*size+col;
+    // built once per board and shared by its copies
+    std::shared_ptr<const std::vector<std::vector<std::pair<int, int>>>> neighbors;
+    
+    const std::vector<std::pair<int, int>>& neighborsOf(int row, int col) const {
+        return (*neighbors)[row * size + col];
+    }
+    uint64_t hash = 0;  // Zobrist hash of board, kept up to date by every move
+    
+    // Union-Find over the cells plus 4 virtual edge nodes, kept up to date by
+    // every move. Union by rank without path compression, so the unions of the
+    // last move can be rolled back when it is undone.
     std::vector<int> parent;
     std::vector<int> rank;
     
-    int find(int x) {
-        if (parent[x] != x){
-            parent[x] = find(parent[x]);
+    struct UnionRecord {
+        int child;           // Root that was attached under another root
+        int root;            // Root it was attached to
+        bool rankIncreased;  // Whether root's rank was bumped
+    };
+    std::vector<UnionRecord> unionHistory;
+    
+    // Cell index of every move made, with the union history length before it
+    std::vector<std::pair<int, size_t>> moveHistory;
+    
+    int find(int x) const {
+        while (parent[x] != x) {
+            x = parent[x];
         }
-        return parent[x];
+        return x;
     }
     
     void unionSets(int x, int y) {
@@ -64,34 +124,21 @@ private:
         
         if (rootX == rootY) return;
         
-        if (rank[rootX] < rank[rootY]){
-            parent[rootX] = rootY;
+        if (rank[rootX] < rank[rootY]) {
+            std::swap(rootX, rootY);
         }
-        else if (rank[rootX] > rank[rootY]){
-            parent[rootY] = rootX;
-        }
-        else {
-            parent[rootY] = rootX;
+        bool rankIncreased = rank[rootX] == rank[rootY];
+        parent[rootY] = rootX;
+        if (rankIncreased) {
             rank[rootX]++;
         }
+        unionHistory.push_back({rootY, rootX, rankIncreased});
     }
     
-    bool hasWon(Player player) {
-        if (player == EMPTY) return false;
-        
-        // Resize parent/rank arrays if needed (should happen in constructor ideally,
-        // but resizing here ensures it's correct even if board size changes)
-        // Need size*size cells + 4 virtual nodes
-        if (parent.size() != size * size + 4) {
-            parent.resize(size * size + 4);
-            rank.resize(size * size + 4, 0);
-        }
-        
-        // Initialize Union-Find data structures
-        for (int i = 0; i < parent.size(); i++) {
-            parent[i] = i;
-            rank[i] = 0;
-        }
+    // Joins the stone at (i, j) to its player's edge nodes and adjacent stones
+    void connectStone(int i, int j) {
+        Player player = board[i][j];
+        int cell = i * size + j;
         
         // Define 4 distinct virtual nodes:
         int topVirtual = size * size;      // Index for Blue's top edge
@@ -99,49 +146,80 @@ private:
         int leftVirtual = size * size + 2;   // Index for Red's left edge
         int rightVirtual = size * size + 3;  // Index for Red's right edge
         
-        // Connect all player's pieces
+        // Connect to appropriate virtual nodes if on the edge
+        if (player == PLAYER1) {
+            if (i == 0) { // Top row
+                unionSets(cell, topVirtual);
+            }
+            if (i == size-1) { // Bottom row
+                unionSets(cell, bottomVirtual);
+            }
+        } else if (player == PLAYER2) {
+            if (j == 0) { // Leftmost column
+                unionSets(cell, leftVirtual);
+            }
+            if (j == size-1) { // Rightmost column
+                unionSets(cell, rightVirtual);
+            }
+        }
+        
+        // Connect to adjacent cells of the same player
+        for (const auto& [ni, nj] : neighborsOf(i, j)) {
+            if (board[ni][nj] == player) {
+                unionSets(cell, ni * size + nj);
+            }
+        }
+    }
+    
+    // Rebuilds the Union-Find from the current board (after a bulk update)
+    void rebuildConnectivity() {
+        parent.resize(size * size + 4);
+        rank.assign(size * size + 4, 0);
+        for (int i = 0; i < size * size + 4; i++) {
+            parent[i] = i;
+        }
+        unionHistory.clear();
+        moveHistory.clear();
+        
         for (int i = 0; i < size; i++) {
             for (int j = 0; j < size; j++) {
-                if (board[i][j] == player) {
-                    // Connect to appropriate virtual nodes if on the edge
-                    if (player == PLAYER1) {
-                        if (i == 0) { // Top row
-                            unionSets(i * size + j, topVirtual);
-                        }
-                        if (i == size-1) { // Bottom row
-                            unionSets(i * size + j, bottomVirtual);
-                        }
-                    } else if (player == PLAYER2) {
-                        if (j == 0) { // Leftmost column
-                            unionSets(i * size + j, leftVirtual);
-                        }
-                        if (j == size-1) { // Rightmost column
-                            unionSets(i * size + j, rightVirtual);
-                        }
-                    }
-                    
-                    // Connect to adjacent cells of the same player
-                    static const int dx[] = {-1, -1, 0, 0, 1, 1};
-                    static const int dy[] = {0, 1, -1, 1, -1, 0};
-                    
-                    for (int k = 0; k < 6; k++) {
-                        int ni = i + dx[k];
-                        int nj = j + dy[k];
-                        
-                        if (ni >= 0 && ni < size && nj >= 0 && nj < size && 
-                            board[ni][nj] == player) {
-                            unionSets(i * size + j, ni * size + nj);
-                        }
-                    }
+                if (board[i][j] != EMPTY) {
+                    connectStone(i, j);
                 }
             }
         }
+    }
+    
+    // Whether a stone of player on the empty cell (row, col) would win, read off
+    // the union-find without copying the board or placing the stone
+    bool wouldWin(int row, int col, Player player) const {
+        if (hasWon(player)) {
+            return true;
+        }
+        
+        int startNode = (player == PLAYER1) ? size * size : size * size + 2;
+        int startRoot = find(startNode);
+        int goalRoot = find(startNode + 1);
+        int edgePos = (player == PLAYER1) ? row : col;
+        bool touchesStart = edgePos == 0;
+        bool touchesGoal = edgePos == size - 1;
+        
+        for (const auto& [nr, nc] : neighborsOf(row, col)) {
+            if (board[nr][nc] == player) {
+                int root = find(nr * size + nc);
+                touchesStart = touchesStart || root == startRoot;
+                touchesGoal = touchesGoal || root == goalRoot;
+            }
+        }
         
-        // Check if virtual nodes are connected
+        return touchesStart && touchesGoal;
+    }
+    
+    bool hasWon(Player player) const {
         if (player == PLAYER1) {
-            return find(topVirtual) == find(bottomVirtual);
+            return find(size * size) == find(size * size + 1);
         } else if (player == PLAYER2) {
-            return find(leftVirtual) == find(rightVirtual);
+            return find(size * size + 2) == find(size * size + 3);
         }
         
         return false;
@@ -165,54 +243,85 @@ private:
             return true;
         }
         
-        std::vector<std::vector<bool>> visited(size, std::vector<bool>(size, false));
-        bool result = checkVCPath(startRow, startCol, endRow, endCol, player, visited);
+        bool result = checkVCPath(startRow, startCol, endRow, endCol, player);
         
         vcCache[key] = result;
         return result;
     }
     
-    bool checkVCPath(int r, int c, int targetR, int targetC, Player player, 
-                    std::vector<std::vector<bool>>& visited) const {
-        if (r < 0 || r >= size || c < 0 || c >= size || visited[r][c]) {
-            return false;
-        }
-        
-        if (r == targetR && c == targetC) {
-            return board[r][c] == player;
-        }
-        
-        if (board[r][c] != player && board[r][c] != EMPTY) {
-            return false;
-        }
-        
-        visited[r][c] = true;
-        
-        static const int dx[] = {-1, -1, 0, 0, 1, 1};
-        static const int dy[] = {0, 1, -1, 1, -1, 0};
-        
-        for (int k = 0; k < 6; k++) {
-            int nr = r + dx[k];
-            int nc = c + dy[k];
+    // Depth-first search over the player's stones and empty cells, using an
+    // explicit stack so long paths on big boards don't recurse per cell
+    bool checkVCPath(int startRow, int startCol, int targetR, int targetC, Player player) const {
+        std::vector<char> visited(size * size, 0);
+        std::vector<int> stack;
+        stack.reserve(size * size);
+        stack.push_back(startRow * size + startCol);
+        
+        while (!stack.empty()) {
+            int idx = stack.back();
+            stack.pop_back();
+            if (visited[idx]) {
+                continue;
+            }
             
-            if (checkVCPath(nr, nc, targetR, targetC, player, visited)) {
-                return true;
+            int r = idx / size;
+            int c = idx % size;
+            if (r == targetR && c == targetC) {
+                if (board[r][c] == player) {
+                    return true;
+                }
+                continue;
+            }
+            
+            if (board[r][c] != player && board[r][c] != EMPTY) {
+                continue;
+            }
+            
+            visited[idx] = 1;
+            
+            for (const auto& [nr, nc] : neighborsOf(r, c)) {
+                if (!visited[nr * size + nc]) {
+                    stack.push_back(nr * size + nc);
+                }
             }
         }
         
         return false;
     }
 
+    void rehash() {
+        hash = 0;
+        for (int i = 0; i < size; i++) {
+            for (int j = 0; j < size; j++) {
+                if (board[i][j] != EMPTY) {
+                    hash ^= zobristKey(size, i * size + j, board[i][j]);
+                }
+            }
+        }
+    }
+
 public:
     HexBoard(int s) : size(s) {
         board.resize(size, std::vector<Player>(size, EMPTY));
-        // Initialize parent/rank arrays for size*size cells + 4 virtual nodes
-        parent.resize(size * size + 4);
-        rank.resize(size * size + 4, 0);
         
-        for (int i = 0; i < size * size + 4; i++) {
-            parent[i] = i;
+        static const int dx[] = {-1, -1, 0, 0, 1, 1};
+        static const int dy[] = {0, 1, -1, 1, -1, 0};
+        auto table = std::make_shared<std::vector<std::vector<std::pair<int, int>>>>(size * size);
+        for (int i = 0; i < size; i++) {
+            for (int j = 0; j < size; j++) {
+                for (int k = 0; k < 6; k++) {
+                    int ni = i + dx[k];
+                    int nj = j + dy[k];
+                    if (ni >= 0 && ni < size && nj >= 0 && nj < size) {
+                        (*table)[i * size + j].push_back({ni, nj});
+                    }
+                }
+            }
         }
+        neighbors = table;
+        
+        // Initialize parent/rank arrays for size*size cells + 4 virtual nodes
+        rebuildConnectivity();
     }
     
     void setBoard(const std::vector<std::vector<int>>& pyBoard) {
@@ -226,6 +335,36 @@ public:
             }
         }
         
+        rehash();
+        rebuildConnectivity();
+        vcCache.clear();
+    }
+    
+    // Copies the board from a contiguous row-major buffer of size*size bytes
+    // (bytes, bytearray or an int8 NumPy array) without unboxing Python ints
+    void setBoardBuffer(py::buffer buffer) {
+        py::buffer_info info = buffer.request();
+        if (info.itemsize != 1 || info.size != size * size) {
+            throw std::invalid_argument("Board buffer size mismatch");
+        }
+        
+        py::ssize_t expectedStride = 1;
+        for (py::ssize_t d = info.ndim - 1; d >= 0; d--) {
+            if (info.strides[d] != expectedStride) {
+                throw std::invalid_argument("Board buffer must be contiguous");
+            }
+            expectedStride *= info.shape[d];
+        }
+        
+        const int8_t* cells = static_cast<const int8_t*>(info.ptr);
+        for (int i = 0; i < size; i++) {
+            for (int j = 0; j < size; j++) {
+                board[i][j] = static_cast<Player>(cells[i * size + j]);
+            }
+        }
+        
+        rehash();
+        rebuildConnectivity();
         vcCache.clear();
     }
     
@@ -245,13 +384,32 @@ public:
         }
         
         board[row][col] = player;
+        hash ^= zobristKey(size, row * size + col, player);
+        moveHistory.push_back({row * size + col, unionHistory.size()});
+        connectStone(row, col);
         vcCache.clear();
         return true;
     }
     
     void undoMove(int row, int col) {
-        if (row >= 0 && row < size && col >= 0 && col < size) {
+        if (row >= 0 && row < size && col >= 0 && col < size && board[row][col] != EMPTY) {
+            hash ^= zobristKey(size, row * size + col, board[row][col]);
             board[row][col] = EMPTY;
+            if (!moveHistory.empty() && moveHistory.back().first == row * size + col) {
+                // Undoing the latest move: roll back just its unions
+                size_t mark = moveHistory.back().second;
+                moveHistory.pop_back();
+                while (unionHistory.size() > mark) {
+                    const UnionRecord& record = unionHistory.back();
+                    parent[record.child] = record.child;
+                    if (record.rankIncreased) {
+                        rank[record.root]--;
+                    }
+                    unionHistory.pop_back();
+                }
+            } else {
+                rebuildConnectivity();
+            }
             vcCache.clear();
         }
     }
@@ -282,9 +440,7 @@ public:
     int calculateMoveScore(int row, int col, Player player) const {
         int score = 0;
         
-        HexBoard tempBoard = *this;
-        tempBoard.makeMove(row, col, player);
-        if (tempBoard.checkWin(player)) {
+        if (wouldWin(row, col, player)) {
             return 10000;
         }
         
@@ -296,22 +452,15 @@ public:
         int centerDist = std::abs(row - size/2) + std::abs(col - size/2);
         score += (size - centerDist);
         
-        static const int dx[] = {-1, -1, 0, 0, 1, 1};
-        static const int dy[] = {0, 1, -1, 1, -1, 0};
-        
+        const auto& adjacent = neighborsOf(row, col);
         int connectionsToSame = 0;
         
-        for (int k = 0; k < 6; k++) {
-            int nr = row + dx[k];
-            int nc = col + dy[k];
-            
-            if (nr >= 0 && nr < size && nc >= 0 && nc < size) {
-                if (board[nr][nc] == player) {
-                    connectionsToSame += 3;
-                    score += 3;
-                } else if (board[nr][nc] == EMPTY) {
-                    score += 1;
-                }
+        for (const auto& [nr, nc] : adjacent) {
+            if (board[nr][nc] == player) {
+                connectionsToSame += 3;
+                score += 3;
+            } else if (board[nr][nc] == EMPTY) {
+                score += 1;
             }
         }
         
@@ -321,17 +470,10 @@ public:
             score += (size - std::abs(row - size/2));
         }
         
-        for (int k = 0; k < 6; k++) {
-            int nr1 = row + dx[k];
-            int nc1 = col + dy[k];
-            
-            if (nr1 >= 0 && nr1 < size && nc1 >= 0 && nc1 < size && board[nr1][nc1] == player) {
-                for (int l = k+1; l < 6; l++) {
-                    int nr2 = row + dx[l];
-                    int nc2 = col + dy[l];
-                    
-                    if (nr2 >= 0 && nr2 < size && nc2 >= 0 && nc2 < size && 
-                        board[nr2][nc2] == player) {
+        for (size_t k = 0; k < adjacent.size(); k++) {
+            if (board[adjacent[k].first][adjacent[k].second] == player) {
+                for (size_t l = k+1; l < adjacent.size(); l++) {
+                    if (board[adjacent[l].first][adjacent[l].second] == player) {
                         score += 5;
                     }
                 }
@@ -368,39 +510,19 @@ public:
     bool isRedundantMove(int row, int col, Player player) const {
         // This function checks if placing a piece at (row, col) would
         // create a redundant connection (i.e., connecting pieces that
-        // are already connected through another path)
-        
-        static const int dx[] = {-1, -1, 0, 0, 1, 1};
-        static const int dy[] = {0, 1, -1, 1, -1, 0};
-        
-        // Find all adjacent cells that have player's pieces
-        std::vector<std::pair<int, int>> adjacentPlayerCells;
-        for (int k = 0; k < 6; k++) {
-            int nr = row + dx[k];
-            int nc = col + dy[k];
-            
-            if (nr >= 0 && nr < size && nc >= 0 && nc < size && board[nr][nc] == player) {
-                adjacentPlayerCells.push_back({nr, nc});
-            }
-        }
-        
-        // If there are fewer than 2 adjacent player pieces, it's not redundant
-        if (adjacentPlayerCells.size() < 2) {
-            return false;
-        }
-        
-        // Check if any pair of adjacent player cells are already connected
-        for (size_t i = 0; i < adjacentPlayerCells.size(); i++) {
-            for (size_t j = i + 1; j < adjacentPlayerCells.size(); j++) {
-                int r1 = adjacentPlayerCells[i].first;
-                int c1 = adjacentPlayerCells[i].second;
-                int r2 = adjacentPlayerCells[j].first;
-                int c2 = adjacentPlayerCells[j].second;
-                
-                // Check if there's already a path connecting these two cells
-                if (hasVirtualConnection(r1, c1, r2, c2, player)) {
-                    return true;
+        // are already connected through another path): two of the adjacent
+        // player pieces already share a Union-Find group
+        int roots[6];
+        int count = 0;
+        for (const auto& [nr, nc] : neighborsOf(row, col)) {
+            if (board[nr][nc] == player) {
+                int root = find(nr * size + nc);
+                for (int k = 0; k < count; k++) {
+                    if (roots[k] == root) {
+                        return true;
+                    }
                 }
+                roots[count++] = root;
             }
         }
         
@@ -419,9 +541,22 @@ public:
         return emptyCells;
     }
     
+    // Number of empty cells where player would win at once, counting up to limit
+    int countWinningCells(Player player, int limit) const {
+        int count = 0;
+        for (int i = 0; i < size && count < limit; i++) {
+            for (int j = 0; j < size && count < limit; j++) {
+                if (board[i][j] == EMPTY && wouldWin(i, j, player)) {
+                    count++;
+                }
+            }
+        }
+        return count;
+    }
+    
     bool isGameOver() const {
         for (int player = PLAYER1; player <= PLAYER2; player++) {
-            if (const_cast<HexBoard*>(this)->hasWon(static_cast<Player>(player))) {
+            if (hasWon(static_cast<Player>(player))) {
                 return true;
             }
         }
@@ -438,16 +573,16 @@ public:
     }
     
     bool checkWin(Player player) const {
-        return const_cast<HexBoard*>(this)->hasWon(player);
+        return hasWon(player);
     }
     
     int evaluate(Player maximizingPlayer) const {
-        if (const_cast<HexBoard*>(this)->hasWon(maximizingPlayer)) {
+        if (hasWon(maximizingPlayer)) {
             return 1000;
         }
         
         Player opponent = (maximizingPlayer == PLAYER1) ? PLAYER2 : PLAYER1;
-        if (const_cast<HexBoard*>(this)->hasWon(opponent)) {
+        if (hasWon(opponent)) {
             return -1000;
         }
         
@@ -469,7 +604,7 @@ public:
             }
         }
         
-        std::vector<std::vector<bool>> visited(size, std::vector<bool>(size, false));
+        std::vector<char> visited(size * size, 0);
         int connectivity = calculateConnectivity(player, visited);
         
         int edgeControl = calculateEdgeControl(player);
@@ -485,12 +620,12 @@ public:
         return score;
     }
     
-    int calculateConnectivity(Player player, std::vector<std::vector<bool>>& visited) const {
+    int calculateConnectivity(Player player, std::vector<char>& visited) const {
         int connectivity = 0;
         
         for (int i = 0; i < size; i++) {
             for (int j = 0; j < size; j++) {
-                if (board[i][j] == player && !visited[i][j]) {
+                if (board[i][j] == player && !visited[i * size + j]) {
                     int groupSize = dfs(i, j, player, visited);
                     connectivity += groupSize * groupSize;
                 }
@@ -518,79 +653,77 @@ public:
         return control;
     }
     
+    // Fewest empty cells the player still has to fill to join their two edges:
+    // 0-1 BFS where own stones cost 0, empty cells cost 1 and opponent stones
+    // block. Returns size*size + 1 if the opponent has cut every path.
     int calculateShortestPath(Player player) const {
-        std::vector<std::vector<int>> distance(size, std::vector<int>(size, INT_MAX));
-        std::vector<std::pair<int, int>> queue;
-        
-        if (player == PLAYER1) {
-            for (int j = 0; j < size; j++) {
-                if (board[0][j] == player || board[0][j] == EMPTY) {
-                    distance[0][j] = (board[0][j] == player) ? 0 : 1;
-                    queue.push_back({0, j});
-                }
-            }
-        } else {
-            for (int i = 0; i < size; i++) {
-                if (board[i][0] == player || board[i][0] == EMPTY) {
-                    distance[i][0] = (board[i][0] == player) ? 0 : 1;
-                    queue.push_back({i, 0});
-                }
+        std::vector<int> distance(size * size, INT_MAX);
+        std::deque<int> queue;
+        
+        // Costs of entering a cell, seeded from every cell on the start edge
+        for (int k = 0; k < size; k++) {
+            int r = (player == PLAYER1) ? 0 : k;
+            int c = (player == PLAYER1) ? k : 0;
+            if (board[r][c] == player) {
+                distance[r * size + c] = 0;
+                queue.push_front(r * size + c);
+            } else if (board[r][c] == EMPTY) {
+                distance[r * size + c] = 1;
+                queue.push_back(r * size + c);
             }
         }
         
-        for (size_t idx = 0; idx < queue.size(); idx++) {
-            int r = queue[idx].first;
-            int c = queue[idx].second;
+        while (!queue.empty()) {
+            int cell = queue.front();
+            queue.pop_front();
+            int r = cell / size;
+            int c = cell % size;
             
-            static const int dx[] = {-1, -1, 0, 0, 1, 1};
-            static const int dy[] = {0, 1, -1, 1, -1, 0};
+            // Cells leave the deque in distance order, so the first goal cell is closest
+            if ((player == PLAYER1 ? r : c) == size - 1) {
+                return distance[cell];
+            }
             
-            for (int k = 0; k < 6; k++) {
-                int nr = r + dx[k];
-                int nc = c + dy[k];
+            for (const auto& [nr, nc] : neighborsOf(r, c)) {
+                if (board[nr][nc] != player && board[nr][nc] != EMPTY) {
+                    continue;
+                }
+                int weight = (board[nr][nc] == player) ? 0 : 1;
+                int newDist = distance[cell] + weight;
                 
-                if (nr >= 0 && nr < size && nc >= 0 && nc < size) {
-                    int newDist = distance[r][c] + ((board[nr][nc] == player) ? 0 : 1);
-                    
-                    if (newDist < distance[nr][nc]) {
-                        distance[nr][nc] = newDist;
-                        queue.push_back({nr, nc});
+                if (newDist < distance[nr * size + nc]) {
+                    distance[nr * size + nc] = newDist;
+                    if (weight == 0) {
+                        queue.push_front(nr * size + nc);
+                    } else {
+                        queue.push_back(nr * size + nc);
                     }
                 }
             }
         }
         
-        int minDist = INT_MAX;
-        
-        if (player == PLAYER1) {
-            for (int j = 0; j < size; j++) {
-                minDist = std::min(minDist, distance[size-1][j]);
-            }
-        } else {
-            for (int i = 0; i < size; i++) {
-                minDist = std::min(minDist, distance[i][size-1]);
-            }
-        }
-        
-        return minDist;
+        return size * size + 1;
     }
     
-    int dfs(int i, int j, Player player, std::vector<std::vector<bool>>& visited) const {
-        if (i < 0 || i >= size || j < 0 || j >= size || 
-            visited[i][j] || board[i][j] != player) {
-            return 0;
-        }
-        
-        visited[i][j] = true;
-        int count = 1;
-        
-        static const int dx[] = {-1, -1, 0, 0, 1, 1};
-        static const int dy[] = {0, 1, -1, 1, -1, 0};
-        
-        for (int k = 0; k < 6; k++) {
-            int ni = i + dx[k];
-            int nj = j + dy[k];
-            count += dfs(ni, nj, player, visited);
+    // Size of the player's group containing the unvisited stone at (i, j),
+    // marking the group visited. Uses an explicit stack instead of recursion.
+    int dfs(int i, int j, Player player, std::vector<char>& visited) const {
+        std::vector<int> stack;
+        stack.push_back(i * size + j);
+        visited[i * size + j] = 1;
+        int count = 0;
+        
+        while (!stack.empty()) {
+            int cell = stack.back();
+            stack.pop_back();
+            count++;
+            
+            for (const auto& [ni, nj] : (*neighbors)[cell]) {
+                if (!visited[ni * size + nj] && board[ni][nj] == player) {
+                    visited[ni * size + nj] = 1;
+                    stack.push_back(ni * size + nj);
+                }
+            }
         }
         
         return count;
@@ -619,10 +752,19 @@ public:
     int getSize() const {
         return size;
     }
+    
+    uint64_t getHash() const {
+        return hash;
+    }
 };
 
+// How many extra plies a search line may get for answering a win threat at
+// the depth limit
+const int MAX_THREAT_EXTENSIONS = 2;
+
 int alphabeta(HexBoard& board, int depth, int alpha, int beta, bool maximizingPlayer, 
-              Player currentPlayer, bool useCache = true) {
+              Player currentPlayer, bool useCache = true,
+              int extensions = MAX_THREAT_EXTENSIONS) {
     
     // Check for immediate win/loss before using the transposition table
     if (board.checkWin(currentPlayer)) {
@@ -635,27 +777,52 @@ int alphabeta(HexBoard& board, int depth, int alpha, int beta, bool maximizingPl
     }
     
     if (useCache) {
-        std::vector<std::vector<int>> boardState = board.getBoard();
-        
-        auto it = transpositionTable.find(boardState);
-        if (it != transpositionTable.end() && it->second.depth >= depth) {
-            TTEntry entry = it->second;
-            if (entry.flag == 0) {
-                return entry.value;
-            } else if (entry.flag == 1) {
-                alpha = std::max(alpha, entry.value);
-            } else if (entry.flag == 2) {
-                beta = std::min(beta, entry.value);
+        const TTEntry* entry = transpositionTable.probe(board.getHash());
+        if (entry != nullptr && entry->depth >= depth) {
+            if (entry->flag == 0) {
+                return entry->value;
+            } else if (entry->flag == 1) {
+                alpha = std::max(alpha, static_cast<int>(entry->value));
+            } else if (entry->flag == 2) {
+                beta = std::min(beta, static_cast<int>(entry->value));
             }
             
             if (alpha >= beta) {
-                return entry.value;
+                return entry->value;
             }
         }
     }
     
     if (depth == 0) {
-        return board.evaluate(currentPlayer);
+        // Settle one-move tactics instead of evaluating them statically: the
+        // side to move wins if it has a winning cell, and loses if the other
+        // side has two it cannot both block; a single threat is searched one
+        // ply further so the forced block is seen
+        Player mover = maximizingPlayer ? currentPlayer : opponent;
+        Player waiting = maximizingPlayer ? opponent : currentPlayer;
+        int moverWins = (mover == currentPlayer) ? 1000 : -1000;
+        int value;
+        int threats = 0;
+        if (board.countWinningCells(mover, 1) > 0) {
+            value = moverWins;
+        } else if ((threats = board.countWinningCells(waiting, 2)) >= 2) {
+            value = -moverWins;
+        } else if (threats == 1 && extensions > 0) {
+            return alphabeta(board, 1, alpha, beta, maximizingPlayer, currentPlayer, useCache,
+                             extensions - 1);
+        } else {
+            value = board.evaluate(currentPlayer);
+        }
+        
+        // Leaves are cached as exact depth-0 entries, so a leaf reached again
+        // through another move order is not evaluated twice. A single threat
+        // scored statically because this line has no extensions left is not
+        // cached: the same position reached with extensions left must still
+        // be searched on.
+        if (useCache && threats != 1) {
+            transpositionTable.store(board.getHash(), 0, value, 0);
+        }
+        return value;
     }
     
     std::vector<std::pair<int, int>> possibleMoves;
@@ -687,7 +854,8 @@ int alphabeta(HexBoard& board, int depth, int alpha, int beta, bool maximizingPl
                 return 1000;
             }
             
-            int childValue = alphabeta(board, depth - 1, alpha, beta, false, currentPlayer, useCache);
+            int childValue = alphabeta(board, depth - 1, alpha, beta, false, currentPlayer, useCache,
+                                       extensions);
             board.undoMove(move.first, move.second);
             
             value = std::max(value, childValue);
@@ -718,7 +886,8 @@ int alphabeta(HexBoard& board, int depth, int alpha, int beta, bool maximizingPl
                 return -1000;
             }
             
-            int childValue = alphabeta(board, depth - 1, alpha, beta, true, currentPlayer, useCache);
+            int childValue = alphabeta(board, depth - 1, alpha, beta, true, currentPlayer, useCache,
+                                       extensions);
             board.undoMove(move.first, move.second);
             
             value = std::min(value, childValue);
@@ -740,8 +909,7 @@ int alphabeta(HexBoard& board, int depth, int alpha, int beta, bool maximizingPl
     
     // Store the result in the transposition table
     if (useCache) {
-        std::vector<std::vector<int>> boardState = board.getBoard();
-        transpositionTable[boardState] = {depth, value, flag};
+        transpositionTable.store(board.getHash(), depth, value, flag);
     }
     
     return value;
@@ -842,6 +1010,32 @@ std::pair<int, int> findBestMove(HexBoard& board, int maxDepth, Player player) {
     return bestMove;
 }
 
+// Scores a single root move for player by searching the reply tree on a private
+// copy of the board. The GIL is released during the search so that several root
+// moves can be evaluated from Python threads at the same time. Passing the best
+// score found so far as alpha lets the search stop early on weaker moves (their
+// result is then only an upper bound, at most alpha). Each thread keeps its
+// transposition table across calls that share the same searchId.
+int evaluateMove(const HexBoard& board, int depth, Player player, int row, int col,
+                 int alpha = INT_MIN, long long searchId = 0) {
+    thread_local long long tableSearchId = -1;
+    HexBoard localBoard = board;
+    py::gil_scoped_release release;
+    
+    if (!localBoard.makeMove(row, col, player)) {
+        return INT_MIN;
+    }
+    if (localBoard.checkWin(player)) {
+        return 1000;
+    }
+    
+    if (searchId != tableSearchId) {
+        transpositionTable.clear();
+        tableSearchId = searchId;
+    }
+    return alphabeta(localBoard, depth - 1, alpha, INT_MAX, false, player, true);
+}
+
 PYBIND11_MODULE(hex_cpp, m) {
     m.doc() = "C++ implementation of Hex game with alpha-beta pruning";
     
@@ -854,6 +1048,7 @@ PYBIND11_MODULE(hex_cpp, m) {
     py::class_<HexBoard>(m, "HexBoard")
         .def(py::init<int>())
         .def("set_board", &HexBoard::setBoard)
+        .def("set_board_buffer", &HexBoard::setBoardBuffer)
         .def("get_board", &HexBoard::getBoard)
         .def("make_move", &HexBoard::makeMove)
         .def("undo_move", &HexBoard::undoMove)
@@ -869,8 +1064,14 @@ PYBIND11_MODULE(hex_cpp, m) {
           py::arg("board"), py::arg("depth") = 3, py::arg("player") = Player::PLAYER1,
           "Find the best move using enhanced alpha-beta pruning with iterative deepening");
     
+    m.def("evaluate_move", &evaluateMove,
+          py::arg("board"), py::arg("depth"), py::arg("player"), py::arg("row"), py::arg("col"),
+          py::arg("alpha") = INT_MIN, py::arg("search_id") = 0,
+          "Score one root move with alpha-beta search, releasing the GIL while searching");
+    
     m.def("alphabeta", &alphabeta,
           py::arg("board"), py::arg("depth"), py::arg("alpha"), py::arg("beta"),
           py::arg("maximizingPlayer"), py::arg("currentPlayer"), py::arg("useCache") = true,
+          py::arg("extensions") = MAX_THREAT_EXTENSIONS,
           "Alpha-beta pruning algorithm with transposition table");
 }
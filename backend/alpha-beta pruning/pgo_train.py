@@ -0,0 +1,31 @@
+"""
+Training run for the profile-guided build of hex_cpp (see setup.py).
+Plays a few fixed 11x11 positions through find_best_move so the
+instrumented module records a representative search profile.
+"""
+import hex_cpp
+
+SIZE = 11
+
+# Fixed openings as (row, col, player) stones
+POSITIONS = [
+    [(5, 5, 1)],
+    [(5, 5, 1), (4, 6, 2)],
+    [(5, 5, 1), (4, 6, 2), (6, 4, 1), (3, 7, 2)],
+    [(2, 3, 1), (5, 5, 2), (4, 4, 1), (6, 6, 2), (7, 2, 1), (5, 8, 2)],
+    [(0, 5, 1), (1, 5, 1), (2, 5, 1), (5, 0, 2), (5, 1, 2), (5, 2, 2), (8, 8, 1)],
+]
+
+def main():
+    for stones in POSITIONS:
+        board = [[0] * SIZE for _ in range(SIZE)]
+        for row, col, player in stones:
+            board[row][col] = player
+        cpp_board = hex_cpp.HexBoard(SIZE)
+        cpp_board.set_board(board)
+        for depth in (1, 2, 3):
+            for player in (hex_cpp.Player.PLAYER1, hex_cpp.Player.PLAYER2):
+                hex_cpp.find_best_move(cpp_board, depth, player)
+
+if __name__ == "__main__":
+    main()
@@ -1,50 +1,139 @@
-import sys, os
+import sys, os, random, logging, time
 from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import chain, count
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "alpha-beta pruning"))
 
-
-from setuptools import setup, Extension
-import pybind11
-
-cpp_module = Extension(
-    'hex_cpp',
-    sources=['alpha-beta-pruning.cpp'],
-    include_dirs=[pybind11.get_include()],
-    language='c++',
-    extra_compile_args=['-std=c++17']
-)
-
-setup(
-    name="hex_cpp",
-    version="0.1",
-    ext_modules=[cpp_module],
-)
-
+logger = logging.getLogger(__name__)
 
 # C++ acceleration module import
+# Build it first with: python setup.py build_ext --inplace (in "alpha-beta pruning")
 try:
-    # Make sure to build the module first with:
-    # python3 -m pip install -e .
     import hex_cpp
-    USE_CPP_IMPLEMENTATION = True
 except ImportError:
-    try:
-        from backend import alpha_beta_pruning
-        USE_CPP_IMPLEMENTATION = True
-    except ImportError:
-        try:
-            import alpha_beta_pruning as hex_cpp
-            USE_CPP_IMPLEMENTATION = True
-            print("C++ acceleration module available successfully")
-        except ImportError:
-            print("Warning: C++ acceleration module not available, using Python implementation")
-            USE_CPP_IMPLEMENTATION = False
+    hex_cpp = None
+    logger.info("C++ acceleration module not available, using Python implementation")
+USE_CPP_IMPLEMENTATION = hex_cpp is not None
+
+# C++ Player enum values indexed by player number (1 = Blue, 2 = Red)
+CPP_PLAYERS = (None, hex_cpp.Player.PLAYER1, hex_cpp.Player.PLAYER2) if USE_CPP_IMPLEMENTATION else None
+
+# Cython win check and search for the Python fallback (build with backend/setup_fallback.py)
+try:
+    import _hex_fallback
+    USE_CYTHON_IMPLEMENTATION = True
+except ImportError:
+    USE_CYTHON_IMPLEMENTATION = False
+
+# Numba-compiled Python fallback (requires numpy and numba). It is only used
+# without hex_cpp and is slow to import, so _load_numba imports it on first use.
+hex_numba = None
+USE_NUMBA_IMPLEMENTATION = None  # Unknown until _load_numba has run
 
 # Hex grid neighbor directions (6 neighbors)
 HEX_DIRECTIONS = [(-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0)]
 
+# Integer score sentinels for the search (cheaper to compare than float infinities)
+NEG_INF, POS_INF = -10**9, 10**9
+
+# Transposition table bound flags
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+
+# Half-width of the iterative deepening aspiration window around the last score
+ASPIRATION_WINDOW = 8
+
+# Seconds the pure Python search may spend per move before it stops deepening
+SEARCH_TIME_BUDGET = 2.0
+
+# Nodes at least this far from the leaves order their moves by connection
+# potential (potential_ordered_moves) instead of center distance alone
+POTENTIAL_ORDER_MIN_DEPTH = 2
+
+# How many extra plies a search line may get for answering a win threat at
+# the depth limit (see alpha_beta)
+MAX_THREAT_EXTENSIONS = 2
+
+# Zobrist keys for the Python search, one table per board size
+_HASH_MASK = (1 << 64) - 1
+_zobrist_cache = {}
+
+# On-board neighbors of every cell, one table per board size
+_neighbor_cache = {}
+_flat_neighbor_cache = {}
+
+# Cells sorted by distance to the center, one list per board size
+_center_order_cache = {}
+
+# Reusable C++ boards, one per board size
+_cpp_board_cache = {}
+
+# Workers for the parallel root search: threads for the C++ search, processes
+# for the pure Python one (both created on first use)
+ROOT_SEARCH_WORKERS = os.cpu_count() or 1
+_root_executor = None
+_root_process_pool = None
+_root_search_ids = count(1)
+
+def neighbor_table(size):
+    """
+    Returns the on-board neighbors of every cell for this board size as a
+    list indexed by r * size + c of ((nr, nc), ...) tuples, built on first use.
+    """
+    table = _neighbor_cache.get(size)
+    if table is None:
+        table = [tuple((r + dr, c + dc) for dr, dc in HEX_DIRECTIONS
+                       if 0 <= r + dr < size and 0 <= c + dc < size)
+                 for r in range(size) for c in range(size)]
+        _neighbor_cache[size] = table
+    return table
+
+def flat_neighbor_table(size):
+    """
+    Returns neighbor_table(size) with every neighbor given as its flat
+    index nr * size + nc, built on first use.
+    """
+    table = _flat_neighbor_cache.get(size)
+    if table is None:
+        table = [tuple(nr * size + nc for nr, nc in cell_neighbors)
+                 for cell_neighbors in neighbor_table(size)]
+        _flat_neighbor_cache[size] = table
+    return table
+
+def center_order(size):
+    """
+    Returns every cell (r, c) of this board size sorted by Manhattan distance
+    to the center (row-major on ties), built on first use.
+    """
+    order = _center_order_cache.get(size)
+    if order is None:
+        center = size // 2
+        order = sorted(((r, c) for r in range(size) for c in range(size)),
+                       key=lambda move: abs(move[0] - center) + abs(move[1] - center))
+        _center_order_cache[size] = order
+    return order
+
+def _load_numba():
+    """Imports hex_numba on the first call; returns whether it is available."""
+    global hex_numba, USE_NUMBA_IMPLEMENTATION
+    if USE_NUMBA_IMPLEMENTATION is None:
+        try:
+            import hex_numba
+            USE_NUMBA_IMPLEMENTATION = True
+        except ImportError:
+            USE_NUMBA_IMPLEMENTATION = False
+    return USE_NUMBA_IMPLEMENTATION
+
+def _get_cpp_board(size):
+    """Returns the cached C++ HexBoard for this size, creating it on first use."""
+    cpp_board = _cpp_board_cache.get(size)
+    if cpp_board is None:
+        cpp_board = hex_cpp.HexBoard(size)
+        _cpp_board_cache[size] = cpp_board
+    return cpp_board
+
 class HexState:
     def __init__(self, size, is_black_turn):
         self.board = [[0] * size for _ in range(size)]
@@ -56,57 +145,159 @@ class HexState:
         new_state.board = [row[:] for row in self.board]
         return new_state
 
-def check_win(board, player):
+def _zobrist_keys(size):
     """
-    Checks if player has a winning path on the board using BFS.
-    Player 1 (Blue): Connects top to bottom
-    Player 2 (Red): Connects left to right
+    Returns the Zobrist keys for this board size, indexed [player][r * size + c].
+    Keys are generated once per size from a fixed seed. Each key holds two
+    64-bit halves: the high half hashes the board, the low half hashes it
+    rotated by 180 degrees (cell index i maps to size * size - 1 - i), which
+    leaves both players' edges in place.
+    """
+    keys = _zobrist_cache.get(size)
+    if keys is None:
+        rng = random.Random(size)
+        cells = size * size
+        base = [[rng.getrandbits(64) for _ in range(cells)] for _ in range(3)]
+        keys = [[(row[i] << 64) | row[cells - 1 - i] for i in range(cells)] for row in base]
+        _zobrist_cache[size] = keys
+    return keys
+
+def _canonical_key(board_hash):
     """
+    Returns (key, rotated) for a zobrist_hash value: the smaller of the hashes
+    of the board and of its 180-degree rotation, and whether it was the latter.
+    A position and its rotation share one transposition table entry.
+    """
+    high, low = board_hash >> 64, board_hash & _HASH_MASK
+    return (low, True) if low < high else (high, False)
+
+def zobrist_hash(board):
+    """Computes the Zobrist hash of a board (see _zobrist_keys) from scratch."""
     size = len(board)
-    queue = deque()
-    visited = set()
-    
-    # Set starting and target edges based on player
+    keys = _zobrist_keys(size)
+    board_hash = 0
+    for r in range(size):
+        for c in range(size):
+            if board[r][c]:
+                board_hash ^= keys[board[r][c]][r * size + c]
+    return board_hash
+
+# Template for a check_win specialized to one board size. Each cell (r, c)
+# occupies byte lane r * size + c of a Python int, so the stone mask comes
+# straight from the board bytes, and every shift and edge mask is a literal.
+_CHECK_WIN_TEMPLATE = """
+def check_win_{size}(board, player):
+    mask = int.from_bytes(bytes(chain.from_iterable(board)).translate(_STONE_TABLES[player]), "little")
     if player == 1:  # Blue: top-to-bottom
-        # Add all player stones in the top row to the queue
-        for col in range(size):
-            if board[0][col] == player:
-                queue.append((0, col))
-                visited.add((0, col))
-        target_check = lambda r, c: r == size - 1  # Check if reached bottom row
+        frontier = reached = mask & {top}
+        goal = {bottom}
     else:  # Red: left-to-right
-        # Add all player stones in the leftmost column to the queue
-        for row in range(size):
-            if board[row][0] == player:
-                queue.append((row, 0))
-                visited.add((row, 0))
-        target_check = lambda r, c: c == size - 1  # Check if reached rightmost column
-    
-    # No starting stones found
-    if not queue:
-        return False
-    
-    # BFS to find a path
-    while queue:
-        row, col = queue.popleft()
-        
-        # Check win condition
-        if target_check(row, col):
+        frontier = reached = mask & {left}
+        goal = {right}
+    while frontier:
+        grown = (frontier >> {row_shift}                      # (-1, 0)
+                 | frontier << {row_shift}                    # (1, 0)
+                 | ((frontier >> {diag_shift}) & {not_left})  # (-1, 1)
+                 | ((frontier << {diag_shift}) & {not_right}) # (1, -1)
+                 | ((frontier >> 8) & {not_right})            # (0, -1)
+                 | ((frontier << 8) & {not_left}))            # (0, 1)
+        frontier = grown & mask & ~reached
+        if frontier & goal:
             return True
-        
-        # Check all six neighboring hexagons
-        for dr, dc in HEX_DIRECTIONS:
-            new_row, new_col = row + dr, col + dc
-            
-            # Check if position is valid and contains player's stone and hasn't been visited
-            if (0 <= new_row < size and 0 <= new_col < size and 
-                board[new_row][new_col] == player and 
-                (new_row, new_col) not in visited):
-                visited.add((new_row, new_col))
-                queue.append((new_row, new_col))
-    
-    # No path found
-    return False
+        reached |= frontier
+    return bool(reached & goal)
+"""
+
+# Byte translation tables mapping a player's stones to 1 and everything else to 0
+_STONE_TABLES = {player: bytes(int(i == player) for i in range(256)) for player in (1, 2)}
+
+# check_win implementation chosen for each board size (Cython or generated)
+_check_win_by_size = {}
+
+def _specialized_check_win(size):
+    """
+    Returns the check_win function for this board size: the Cython one when
+    it is built and supports the size, otherwise one generated from
+    _CHECK_WIN_TEMPLATE. Chosen on first use, so check_win tests no flags.
+    """
+    func = _check_win_by_size.get(size)
+    if func is None:
+        if USE_CYTHON_IMPLEMENTATION and size <= _hex_fallback.MAX_SIZE:
+            func = _cython_check_win(size)
+        else:
+            func = _generate_check_win(size)
+        _check_win_by_size[size] = func
+    return func
+
+def _cython_check_win(size):
+    """Wraps _hex_fallback.check_win_c for list-of-lists boards of this size."""
+    check_win_c = _hex_fallback.check_win_c
+    def check_win_cython(board, player):
+        return check_win_c(bytes(chain.from_iterable(board)), size, player)
+    return check_win_cython
+
+def _generate_check_win(size):
+    """Generates the bitboard check_win for this board size."""
+    def lanes(cells):
+        return sum(1 << (8 * cell) for cell in cells)
+    top = lanes(range(size))
+    left = lanes(r * size for r in range(size))
+    all_cells = lanes(range(size * size))
+    source = _CHECK_WIN_TEMPLATE.format(
+        size=size,
+        top=top,
+        bottom=top << (8 * size * (size - 1)),
+        left=left,
+        right=left << (8 * (size - 1)),
+        not_left=all_cells & ~left,
+        not_right=all_cells & ~(left << (8 * (size - 1))),
+        row_shift=8 * size,
+        diag_shift=8 * (size - 1),
+    )
+    namespace = {"chain": chain, "_STONE_TABLES": _STONE_TABLES}
+    exec(source, namespace)
+    return namespace["check_win_%d" % size]
+
+def _parallel_root_search(cpp_board, depth, cpp_player):
+    """
+    Root-split C++ search: the move picked by a shallower search is searched
+    alone to get a score bound, then the remaining root moves are searched
+    against that bound on a thread pool. Returns the best move (the first searched on ties).
+    """
+    global _root_executor
+    if _root_executor is None:
+        _root_executor = ThreadPoolExecutor(max_workers=ROOT_SEARCH_WORKERS)
+    
+    moves = cpp_board.get_ordered_moves(cpp_player)
+    if not moves:
+        return (-1, -1)
+    
+    # A shallower serial search picks the move most likely to be best, which
+    # gives the parallel searches a tight bound
+    eldest = tuple(hex_cpp.find_best_move(cpp_board, depth - 1, cpp_player))
+    if eldest in moves:
+        moves.remove(eldest)
+        moves.insert(0, eldest)
+    
+    # Workers reuse their transposition tables only within this search
+    search_id = next(_root_search_ids)
+    first_score = hex_cpp.evaluate_move(cpp_board, depth, cpp_player, moves[0][0], moves[0][1],
+                                        search_id=search_id)
+    scores = [first_score]
+    scores.extend(_root_executor.map(
+        lambda move: hex_cpp.evaluate_move(cpp_board, depth, cpp_player, move[0], move[1],
+                                           first_score, search_id),
+        moves[1:]))
+    best_index = max(range(len(moves)), key=scores.__getitem__)
+    return moves[best_index]
+
+def check_win(board, player):
+    """
+    Checks if player has a winning path on the board using a bitboard flood-fill.
+    Player 1 (Blue): Connects top to bottom
+    Player 2 (Red): Connects left to right
+    """
+    return _specialized_check_win(len(board))(board, player)
 
 def evaluate(board, is_black_turn):
     """Evaluates the board state for the current player."""
@@ -119,102 +310,476 @@ def evaluate(board, is_black_turn):
     if check_win(board, opponent):
         return -1000
     
-    # Heuristic evaluation
-    size = len(board)
-    player_score = opponent_score = 0
-    
-    for i in range(size):
-        for j in range(size):
-            if board[i][j] == player:
-                player_score += 1
-                # Bonus for edge pieces
-                if (player == 1 and (i == 0 or i == size-1)) or (player == 2 and (j == 0 or j == size-1)):
-                    player_score += 2
-            elif board[i][j] == opponent:
-                opponent_score += 1
-                # Bonus for edge pieces
-                if (opponent == 1 and (i == 0 or i == size-1)) or (opponent == 2 and (j == 0 or j == size-1)):
-                    opponent_score += 2
+    return _heuristic_score(board, player)
+
+def _heuristic_score(board, player):
+    """Scores a position without a winner: one point per stone plus a bonus for goal-edge stones."""
+    opponent = 3 - player
+    player_score = sum(row.count(player) for row in board) + 2 * _edge_stones(board, player)
+    opponent_score = sum(row.count(opponent) for row in board) + 2 * _edge_stones(board, opponent)
     
     return player_score - opponent_score
 
+def _edge_stones(board, player):
+    """Counts player's stones lying on their own goal edges."""
+    last = len(board) - 1
+    if player == 1:  # Blue: top and bottom rows
+        count = board[0].count(player)
+        if last:
+            count += board[last].count(player)
+        return count
+    # Red: leftmost and rightmost columns
+    count = 0
+    for row in board:
+        if row[0] == player:
+            count += 1
+        if last and row[last] == player:
+            count += 1
+    return count
+
 def get_valid_moves(board):
     """Returns list of valid moves (empty cells)."""
+    return [(i, j) for i, row in enumerate(board) for j, cell in enumerate(row) if cell == 0]
+
+def center_first_moves(board):
+    """Returns the valid moves ordered center-first, as in center_order."""
+    return [move for move in center_order(len(board)) if board[move[0]][move[1]] == 0]
+
+def _edge_distances(cells, size, player, from_goal):
+    """
+    0-1 BFS from one of player's edges (the start edge, or the goal edge if
+    from_goal) over the flat row-major board cells: the number of empty cells
+    player must fill to reach each cell, the cell itself included. Own stones
+    are free and opponent stones block; unreachable cells get size * size + 1.
+    Returns a list indexed by r * size + c.
+    """
+    neighbors = flat_neighbor_table(size)
+    dist = [size * size + 1] * (size * size)
+    queue = deque()
+    edge = size - 1 if from_goal else 0
+    for k in range(size):
+        idx = edge * size + k if player == 1 else k * size + edge
+        cell = cells[idx]
+        if cell == player:
+            dist[idx] = 0
+            queue.appendleft(idx)
+        elif cell == 0:
+            dist[idx] = 1
+            queue.append(idx)
+    
+    while queue:
+        idx = queue.popleft()
+        d = dist[idx]
+        for nidx in neighbors[idx]:
+            cell = cells[nidx]
+            if cell == player:
+                if d < dist[nidx]:
+                    dist[nidx] = d
+                    queue.appendleft(nidx)
+            elif cell == 0 and d + 1 < dist[nidx]:
+                dist[nidx] = d + 1
+                queue.append(nidx)
+    return dist
+
+def potential_ordered_moves(board):
+    """
+    Returns the valid moves ordered by connection potential: cells on the
+    cheapest remaining edge-to-edge connections of both players come first
+    (an empty cell's potential for a player is the number of empty cells on
+    their cheapest connection through it), center-first on ties.
+    """
     size = len(board)
-    return [(i, j) for i in range(size) for j in range(size) if board[i][j] == 0]
+    cells = bytes(chain.from_iterable(board))
+    potential = [sum(ds) for ds in zip(_edge_distances(cells, size, 1, False),
+                                       _edge_distances(cells, size, 1, True),
+                                       _edge_distances(cells, size, 2, False),
+                                       _edge_distances(cells, size, 2, True))]
+    moves = [move for move in center_order(size) if cells[move[0] * size + move[1]] == 0]
+    moves.sort(key=lambda move: potential[move[0] * size + move[1]])
+    return moves
+
+class RollbackUnionFind:
+    """
+    Union-find with union by rank and no path compression, so unions can
+    be undone in reverse order by rolling back to a checkpoint.
+    """
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.rank = [0] * n
+        self.history = []
+    
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            x = parent[x]
+        return x
+    
+    def union(self, x, y):
+        root_x = self.find(x)
+        root_y = self.find(y)
+        if root_x == root_y:
+            return
+        if self.rank[root_x] < self.rank[root_y]:
+            root_x, root_y = root_y, root_x
+        rank_increased = self.rank[root_x] == self.rank[root_y]
+        self.parent[root_y] = root_x
+        if rank_increased:
+            self.rank[root_x] += 1
+        self.history.append((root_y, root_x, rank_increased))
+    
+    def checkpoint(self):
+        return len(self.history)
+    
+    def rollback(self, checkpoint):
+        history = self.history
+        while len(history) > checkpoint:
+            child, root, rank_increased = history.pop()
+            self.parent[child] = child
+            if rank_increased:
+                self.rank[root] -= 1
+
+class HexConnectivity:
+    """
+    Incremental win detection for a board that is modified in place.
+    Each player has a union-find over the cells plus two virtual nodes for
+    their start and goal edges; a player has won when those are joined.
+    It also keeps each player's _heuristic_score stone total up to date,
+    and how many rows (Blue) or columns (Red) hold at least one of their stones.
+    """
+    def __init__(self, board):
+        self.board = board
+        self.size = len(board)
+        cells = self.size * self.size
+        self.start_node, self.goal_node = cells, cells + 1
+        self.sets = (None, RollbackUnionFind(cells + 2), RollbackUnionFind(cells + 2))
+        self.neighbors = neighbor_table(self.size)
+        self.stone_scores = [0, 0, 0]
+        self.line_counts = (None, [0] * self.size, [0] * self.size)
+        self.lines_covered = [0, 0, 0]
+        for r in range(self.size):
+            for c in range(self.size):
+                if board[r][c]:
+                    self.place(r, c, board[r][c])
+    
+    def place(self, r, c, player):
+        """
+        Records player's stone at (r, c), which must already be on the board.
+        Returns a checkpoint to pass to undo().
+        """
+        size, board = self.size, self.board
+        uf = self.sets[player]
+        idx = r * size + c
+        edge_pos = r if player == 1 else c
+        checkpoint = (uf.checkpoint(), self.stone_scores[player], edge_pos)
+        
+        # One point per stone, plus two on the player's goal edges
+        self.stone_scores[player] += 3 if edge_pos == 0 or edge_pos == size - 1 else 1
+        line_counts = self.line_counts[player]
+        if not line_counts[edge_pos]:
+            self.lines_covered[player] += 1
+        line_counts[edge_pos] += 1
+        
+        # Connect to the virtual edge nodes
+        if edge_pos == 0:
+            uf.union(idx, self.start_node)
+        if edge_pos == size - 1:
+            uf.union(idx, self.goal_node)
+        
+        # Connect to adjacent stones of the same player
+        for nr, nc in self.neighbors[idx]:
+            if board[nr][nc] == player:
+                uf.union(idx, nr * size + nc)
+        return checkpoint
+    
+    def undo(self, player, checkpoint):
+        """Reverts the unions and score changes made since checkpoint for player."""
+        uf_checkpoint, self.stone_scores[player], edge_pos = checkpoint
+        line_counts = self.line_counts[player]
+        line_counts[edge_pos] -= 1
+        if not line_counts[edge_pos]:
+            self.lines_covered[player] -= 1
+        self.sets[player].rollback(uf_checkpoint)
+    
+    def has_won(self, player):
+        uf = self.sets[player]
+        return uf.find(self.start_node) == uf.find(self.goal_node)
+    
+    def winning_cells(self, player, limit):
+        """
+        Counts the empty cells where a stone would win at once for player,
+        stopping at limit. A winning path crosses every row (Blue) or column
+        (Red), so this returns 0 without scanning while player's stones
+        leave two or more of them empty.
+        """
+        size, board = self.size, self.board
+        covered = self.lines_covered[player]
+        if covered < size - 1:
+            return 0
+        if covered == size - 1:
+            # The winning stone has to fill the one empty line
+            line = self.line_counts[player].index(0)
+            candidates = [(line, k) if player == 1 else (k, line) for k in range(size)]
+        else:
+            candidates = center_order(size)
+        
+        neighbors = self.neighbors
+        find = self.sets[player].find
+        start, goal = find(self.start_node), find(self.goal_node)
+        count = 0
+        for r, c in candidates:
+            if board[r][c]:
+                continue
+            edge_pos = r if player == 1 else c
+            touches_start = edge_pos == 0
+            touches_goal = edge_pos == size - 1
+            for nr, nc in neighbors[r * size + c]:
+                if board[nr][nc] == player:
+                    root = find(nr * size + nc)
+                    if root == start:
+                        touches_start = True
+                    elif root == goal:
+                        touches_goal = True
+            if touches_start and touches_goal:
+                count += 1
+                if count >= limit:
+                    return count
+        return count
+    
+    def heuristic_score(self, player):
+        """Same as _heuristic_score(board, player), without scanning the board."""
+        return self.stone_scores[player] - self.stone_scores[3 - player]
 
-def alpha_beta(board, depth, alpha, beta, is_maximizing_player, current_player):
-    """Alpha-beta pruning algorithm for Hex."""
+def alpha_beta(board, depth, alpha, beta, current_player,
+               tt=None, board_hash=0, connectivity=None, pv_hint=None,
+               killers=None, ply=0, extensions=MAX_THREAT_EXTENSIONS):
+    """
+    Alpha-beta pruning algorithm for Hex, in negamax form: scores are from
+    the point of view of current_player, the side to move. A decided game
+    scores 1000 minus its distance in plies from the root (ply counts the
+    plies already made), so quicker wins and slower losses are preferred.
+    pv_hint, if given, is searched first (e.g. the best move of a shallower
+    search); otherwise the move stored in the transposition table is.
+    killers, if given, holds two killer moves per ply (moves that caused a
+    cutoff at that ply); they are tried right after pv_hint.
+    When a transposition table dict is passed as tt, board_hash must be the
+    Zobrist hash of board; it is updated incrementally as moves are made.
+    When a HexConnectivity for board is passed, it replaces the per-node
+    check_win scans and is kept in sync as moves are made and undone.
+    Moves after the first are searched with a null window (principal
+    variation search) and re-searched only if they might beat it.
+    With a HexConnectivity, leaves where one move decides the game are not
+    scored statically: a win for the side to move, a loss against two
+    threats, and one more ply (at most extensions times per line) to see
+    the forced block of a single threat.
+    """
     size = len(board)
     opponent = 3 - current_player
     
     # Terminal conditions
-    if depth == 0 or check_win(board, 1) or check_win(board, 2):
+    if connectivity is not None:
+        if connectivity.has_won(current_player):
+            return 1000 - ply, None
+        if connectivity.has_won(opponent):
+            return ply - 1000, None
+        if depth == 0:
+            if connectivity.winning_cells(current_player, 1):
+                return 1000 - (ply + 1), None
+            threats = connectivity.winning_cells(opponent, 2)
+            if threats >= 2:
+                return (ply + 2) - 1000, None
+            if threats == 0 or extensions == 0:
+                return connectivity.heuristic_score(current_player), None
+            depth, extensions = 1, extensions - 1
+    elif depth == 0 or check_win(board, 1) or check_win(board, 2):
         return evaluate(board, current_player == 1), None
     
-    # Get valid moves
-    valid_moves = get_valid_moves(board)
+    # Transposition table lookup
+    original_alpha, original_beta = alpha, beta
+    if tt is not None:
+        tt_key, rotated = _canonical_key(board_hash)
+        entry = tt.get(tt_key)
+        if entry is not None:
+            _, value, flag, move = entry
+            if rotated and move is not None:
+                move = (size - 1 - move[0], size - 1 - move[1])
+        if entry is not None and pv_hint is None:
+            # Best move from an earlier (possibly shallower) search of this position
+            pv_hint = move
+        if entry is not None and entry[0] >= depth:
+            if flag == TT_EXACT:
+                return value, move
+            elif flag == TT_LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value, move
+        keys = _zobrist_keys(size)[current_player]
+    
+    # Get valid moves, most promising first (better performance)
+    if depth >= POTENTIAL_ORDER_MIN_DEPTH:
+        valid_moves = potential_ordered_moves(board)
+    else:
+        valid_moves = center_first_moves(board)
     if not valid_moves:
         return evaluate(board, current_player == 1), None
     
-    # Try center moves first (better performance)
-    center = size // 2
-    valid_moves.sort(key=lambda move: abs(move[0] - center) + abs(move[1] - center))
-    
-    if is_maximizing_player:
-        max_eval = float('-inf')
-        best_move = None
-        for move in valid_moves:
-            r, c = move
-            board[r][c] = current_player
-            eval_score, _ = alpha_beta(board, depth - 1, alpha, beta, False, opponent)
-            board[r][c] = 0  # Undo move
-            
-            if eval_score > max_eval:
-                max_eval = eval_score
-                best_move = move
-            alpha = max(alpha, eval_score)
-            if beta <= alpha:
-                break  # Beta cutoff
-        return max_eval, best_move
-    else:
-        min_eval = float('inf')
-        best_move = None
-        for move in valid_moves:
-            r, c = move
-            board[r][c] = current_player
-            eval_score, _ = alpha_beta(board, depth - 1, alpha, beta, True, opponent)
-            board[r][c] = 0  # Undo move
-            
-            if eval_score < min_eval:
-                min_eval = eval_score
-                best_move = move
-            beta = min(beta, eval_score)
-            if beta <= alpha:
-                break  # Alpha cutoff
-        return min_eval, best_move
+    first_moves = [pv_hint] if killers is None else [pv_hint, *killers[ply]]
+    for move in reversed(first_moves):
+        if move in valid_moves:
+            valid_moves.remove(move)
+            valid_moves.insert(0, move)
+    
+    best_eval = NEG_INF
+    best_move = None
+    child_hash = board_hash
+    for move in valid_moves:
+        r, c = move
+        board[r][c] = current_player
+        if tt is not None:
+            child_hash = board_hash ^ keys[r * size + c]
+        if connectivity is not None:
+            checkpoint = connectivity.place(r, c, current_player)
+        if best_move is None:
+            eval_score = -alpha_beta(board, depth - 1, -beta, -alpha, opponent,
+                                     tt, child_hash, connectivity,
+                                     killers=killers, ply=ply + 1, extensions=extensions)[0]
+        else:
+            eval_score = -alpha_beta(board, depth - 1, -alpha - 1, -alpha, opponent,
+                                     tt, child_hash, connectivity,
+                                     killers=killers, ply=ply + 1, extensions=extensions)[0]
+            if alpha < eval_score < beta:
+                eval_score = -alpha_beta(board, depth - 1, -beta, -eval_score, opponent,
+                                         tt, child_hash, connectivity,
+                                         killers=killers, ply=ply + 1, extensions=extensions)[0]
+        if connectivity is not None:
+            connectivity.undo(current_player, checkpoint)
+        board[r][c] = 0  # Undo move
+        
+        if eval_score > best_eval:
+            best_eval = eval_score
+            best_move = move
+        alpha = max(alpha, eval_score)
+        if beta <= alpha:
+            _store_killer(killers, ply, move)
+            break  # Cutoff
+    
+    # Store the result with the kind of bound it represents
+    if tt is not None:
+        if best_eval <= original_alpha:
+            flag = TT_UPPER
+        elif best_eval >= original_beta:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        stored_move = best_move
+        if rotated and best_move is not None:
+            stored_move = (size - 1 - best_move[0], size - 1 - best_move[1])
+        tt[tt_key] = (depth, best_eval, flag, stored_move)
+    
+    return best_eval, best_move
+
+def _store_killer(killers, ply, move):
+    """Records move as the newest killer at ply, keeping the previous one second."""
+    if killers is not None and killers[ply][0] != move:
+        killers[ply][1] = killers[ply][0]
+        killers[ply][0] = move
+
+def iterative_deepening(board, depth, current_player, time_budget=None):
+    """
+    Runs alpha_beta at depths 1..depth, trying the previous iteration's best
+    move first. The transposition table and killer moves are shared between
+    iterations, and each iteration after the first starts with an aspiration
+    window around the previous score, re-searching with a full window if the
+    score falls outside it.
+    If time_budget (in seconds) is given, no further iteration is started
+    once it has run out.
+    Returns the best move of the deepest search.
+    """
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    tt = {}
+    max_ply = depth + MAX_THREAT_EXTENSIONS
+    killers = [[None, None] for _ in range(max_ply)]
+    board_hash = zobrist_hash(board)
+    connectivity = HexConnectivity(board)
+    best_move = None
+    score = None
+    for current_depth in range(1, depth + 1):
+        # No aspiration window around a decided game (see alpha_beta's scores)
+        if score is None or abs(score) >= 1000 - (max_ply + 2):
+            alpha, beta = NEG_INF, POS_INF
+        else:
+            alpha, beta = score - ASPIRATION_WINDOW, score + ASPIRATION_WINDOW
+        score, move = alpha_beta(board, current_depth, alpha, beta, current_player,
+                                 tt, board_hash, connectivity, pv_hint=best_move,
+                                 killers=killers)
+        if score <= alpha or score >= beta:
+            score, move = alpha_beta(board, current_depth, NEG_INF, POS_INF, current_player,
+                                     tt, board_hash, connectivity, pv_hint=best_move,
+                                     killers=killers)
+        best_move = move
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+    return best_move
+
+def _search_root_move(board, depth, current_player, bound, move):
+    """
+    Scores one root move for current_player with alpha_beta against the
+    bound set by the first root move (NEG_INF for an open window). Runs in a
+    worker process for _parallel_python_search; board is left unchanged.
+    """
+    r, c = move
+    board[r][c] = current_player
+    score, _ = alpha_beta(board, depth - 1, NEG_INF, -bound, 3 - current_player,
+                          {}, zobrist_hash(board), HexConnectivity(board))
+    board[r][c] = 0  # Undo move
+    return -score
+
+def _parallel_python_search(board, depth, current_player):
+    """
+    Root-split Python search: the move picked by a shallower iterative
+    deepening search is searched alone to get a score bound, then the
+    remaining root moves are searched against that bound in worker processes
+    (each with its own transposition table). Returns the best move (the first
+    searched on ties).
+    """
+    global _root_process_pool
+    if _root_process_pool is None:
+        _root_process_pool = ProcessPoolExecutor(max_workers=ROOT_SEARCH_WORKERS)
+    
+    moves = center_first_moves(board)
+    if not moves:
+        return None
+    
+    eldest = iterative_deepening(board, depth - 1, current_player)
+    if eldest in moves:
+        moves.remove(eldest)
+        moves.insert(0, eldest)
+    
+    first_score = _search_root_move(board, depth, current_player, NEG_INF, moves[0])
+    search = partial(_search_root_move, board, depth, current_player, first_score)
+    chunksize = max(1, (len(moves) - 1) // (ROOT_SEARCH_WORKERS * 4))
+    scores = [first_score]
+    scores.extend(_root_process_pool.map(search, moves[1:], chunksize=chunksize))
+    return moves[max(range(len(moves)), key=scores.__getitem__)]
 
 def find_best_move(state, depth=3):
     """Finds the best move for the current player."""
     player = 1 if state.is_black_turn else 2
     size = len(state.board)
-    empty_count = sum(row.count(0) for row in state.board)
+    
+    # The board as flat row-major bytes, shared by the opening checks and the C++ search
+    cells = bytes(chain.from_iterable(state.board))
+    stones = size * size - cells.count(0)
     
     # Handle empty board - play in center
-    if empty_count == size * size:
+    if not stones:
         center = size // 2
         return (center, center)
     
     # Second move strategy
-    if empty_count == size * size - 1 and player == 2:
-        first_move = None
-        for r in range(size):
-            for c in range(size):
-                if state.board[r][c] != 0:
-                    first_move = (r, c)
-                    break
-            if first_move:
-                break
+    if player == 2 and stones == 1:
+        first_move = divmod(size * size - len(cells.lstrip(b"\0")), size)
         
         center = size // 2
         if first_move[0] == center and first_move[1] == center:
@@ -225,16 +790,19 @@ def find_best_move(state, depth=3):
     # Use C++ implementation if available
     if USE_CPP_IMPLEMENTATION:
         try:
-            cpp_board = hex_cpp.HexBoard(size)
-            cpp_board.set_board(state.board)
-            cpp_player = hex_cpp.Player.PLAYER1 if player == 1 else hex_cpp.Player.PLAYER2
-            row, col = hex_cpp.find_best_move(cpp_board, depth, cpp_player)
+            cpp_board = _get_cpp_board(size)
+            cpp_board.set_board_buffer(cells)
+            cpp_player = CPP_PLAYERS[player]
+            if ROOT_SEARCH_WORKERS > 1 and depth > 1:
+                row, col = _parallel_root_search(cpp_board, depth, cpp_player)
+            else:
+                row, col = hex_cpp.find_best_move(cpp_board, depth, cpp_player)
             return (row, col)
         except Exception:
             pass  # Fall back to Python implementation
     
     # Python implementation
-    empty_cells = get_valid_moves(state.board)
+    empty_cells = center_first_moves(state.board)
     if not empty_cells:
         return (-1, -1)
     
@@ -242,20 +810,25 @@ def find_best_move(state, depth=3):
         adjusted_depth = min(depth, 4 if size <= 7 else 3 if size <= 9 else 2)
         board_copy = [row[:] for row in state.board]
         current_player = 1 if state.is_black_turn else 2
-        _, move = alpha_beta(board_copy, adjusted_depth, float('-inf'), float('inf'),
-                            state.is_black_turn, current_player)
+        if _load_numba():
+            move = hex_numba.find_move(board_copy, adjusted_depth, state.is_black_turn, current_player)
+        elif USE_CYTHON_IMPLEMENTATION and size <= _hex_fallback.MAX_SIZE:
+            move = _hex_fallback.find_move_c(bytes(chain.from_iterable(board_copy)), size,
+                                             adjusted_depth, state.is_black_turn, current_player)
+        elif ROOT_SEARCH_WORKERS > 1 and adjusted_depth > 1:
+            move = _parallel_python_search(board_copy, adjusted_depth, current_player)
+        else:
+            move = iterative_deepening(board_copy, adjusted_depth, current_player, SEARCH_TIME_BUDGET)
         if move and 0 <= move[0] < size and 0 <= move[1] < size and state.board[move[0]][move[1]] == 0:
             return move
     except Exception:
         pass  # Fall back to heuristic
     
     # Fallback: play near existing pieces or center
-    center = size // 2
-    empty_cells.sort(key=lambda pos: abs(pos[0] - center) + abs(pos[1] - center))
+    neighbors = neighbor_table(size)
     for row, col in empty_cells:
-        for dr, dc in HEX_DIRECTIONS:
-            nr, nc = row + dr, col + dc
-            if 0 <= nr < size and 0 <= nc < size and state.board[nr][nc] == player:
+        for nr, nc in neighbors[row * size + col]:
+            if state.board[nr][nc] == player:
                 return (row, col)
     
     # Just play the first available move
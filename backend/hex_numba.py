@@ -0,0 +1,374 @@
+"""
+Numba-compiled alpha-beta search for the Python fallback.
+
+Used by back.find_best_move when the C++ module is not available. It runs as
+native code on a flat int8 board of length size * size (cell (r, c) lives at
+index r * size + c). It is a max/min alpha-beta with center-first move
+ordering, a Zobrist transposition table, iterative deepening and, with
+several numba threads, a root split of the last depth. It has none of
+back.alpha_beta's principal variation search, potential move ordering,
+killer moves or threat extensions, so the two can choose different moves.
+"""
+from functools import lru_cache
+
+import numpy as np
+from numba import get_num_threads, njit, prange
+
+# Score sentinels standing in for float('-inf') / float('inf')
+INF = 1 << 30
+
+# Hex grid neighbor directions (6 neighbors), same order as back.HEX_DIRECTIONS
+DIRECTION_ROWS = np.array([-1, -1, 0, 0, 1, 1], dtype=np.int64)
+DIRECTION_COLS = np.array([0, 1, -1, 1, -1, 0], dtype=np.int64)
+
+# Transposition table: number of slots (a power of two) and bound flags,
+# same meaning as back.TT_EXACT / TT_LOWER / TT_UPPER
+TT_SIZE = 1 << 16
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2
+
+
+@njit(cache=True, boundscheck=False)
+def _check_win_flat(board, size, player, visited, stack):
+    """
+    Stack-based flood-fill from the player's starting edge.
+    visited and stack are scratch arrays of size * size cells, reused across calls.
+    """
+    visited[:] = 0
+    top = 0
+
+    for k in range(size):
+        idx = k if player == 1 else k * size  # Blue: top row, Red: left column
+        if board[idx] == player:
+            visited[idx] = 1
+            stack[top] = idx
+            top += 1
+
+    while top > 0:
+        top -= 1
+        idx = stack[top]
+        row = idx // size
+        col = idx - row * size
+        if (player == 1 and row == size - 1) or (player == 2 and col == size - 1):
+            return True
+
+        for d in range(6):
+            nr = row + DIRECTION_ROWS[d]
+            nc = col + DIRECTION_COLS[d]
+            if 0 <= nr < size and 0 <= nc < size:
+                nidx = nr * size + nc
+                if board[nidx] == player and visited[nidx] == 0:
+                    visited[nidx] = 1
+                    stack[top] = nidx
+                    top += 1
+
+    return False
+
+
+@njit(cache=True, boundscheck=False)
+def _move_wins(board, size, idx, player, visited, stack):
+    """
+    Checks whether the player's stone at idx (their last move) completes a
+    winning path, by flooding only its group and testing both goal edges.
+    """
+    visited[:] = 0
+    visited[idx] = 1
+    stack[0] = idx
+    top = 1
+    touches_start = False
+    touches_goal = False
+
+    while top > 0:
+        top -= 1
+        cell = stack[top]
+        row = cell // size
+        col = cell - row * size
+        edge_pos = row if player == 1 else col
+        if edge_pos == 0:
+            touches_start = True
+        if edge_pos == size - 1:
+            touches_goal = True
+        if touches_start and touches_goal:
+            return True
+
+        for d in range(6):
+            nr = row + DIRECTION_ROWS[d]
+            nc = col + DIRECTION_COLS[d]
+            if 0 <= nr < size and 0 <= nc < size:
+                nidx = nr * size + nc
+                if board[nidx] == player and visited[nidx] == 0:
+                    visited[nidx] = 1
+                    stack[top] = nidx
+                    top += 1
+
+    return False
+
+
+@njit(cache=True, boundscheck=False)
+def _stone_score(board, size, player):
+    """One point per stone plus two for each stone on the player's goal edges."""
+    score = 0
+    for idx in range(size * size):
+        if board[idx] == player:
+            score += 1
+            row = idx // size
+            col = idx - row * size
+            if player == 1 and (row == 0 or row == size - 1):
+                score += 2
+            elif player == 2 and (col == 0 or col == size - 1):
+                score += 2
+    return score
+
+
+@njit(cache=True, boundscheck=False)
+def _win_score(board):
+    """Score of a won position for the winner: 1000 plus the empty cells left, so quicker wins score higher."""
+    score = 1000
+    for idx in range(board.shape[0]):
+        if board[idx] == 0:
+            score += 1
+    return score
+
+
+@njit(cache=True, boundscheck=False)
+def _evaluate_flat(board, size, player, visited, stack):
+    """Flat-board equivalent of back.evaluate for the given player (wins scored by _win_score)."""
+    opponent = 3 - player
+    if _check_win_flat(board, size, player, visited, stack):
+        return _win_score(board)
+    if _check_win_flat(board, size, opponent, visited, stack):
+        return -_win_score(board)
+    return _stone_score(board, size, player) - _stone_score(board, size, opponent)
+
+
+@njit(cache=True, boundscheck=False)
+def _alpha_beta_flat(board, size, order, depth, alpha, beta, is_maximizing_player, current_player,
+                     last_move, visited, stack, board_hash, keys, tt):
+    """
+    Alpha-beta search over the flat board, undoing moves in place. Scores
+    are from the maximizing player's point of view (player 1 in find_move),
+    whichever side is to move.
+    last_move is the opponent's stone placed by the parent node (-1 at the root).
+    board_hash is the Zobrist hash of board under keys; tt is the
+    transposition table built by _new_tt (direct-mapped, always replace).
+    Returns (score, index of the best move or -1).
+    """
+    opponent = 3 - current_player
+    sign = 1 if is_maximizing_player else -1  # Turns side-to-move scores into the maximizer's
+    tt_keys, tt_values, tt_depths, tt_flags, tt_moves = tt
+
+    # Terminal conditions
+    if last_move < 0:
+        if (depth == 0 or _check_win_flat(board, size, 1, visited, stack)
+                or _check_win_flat(board, size, 2, visited, stack)):
+            return sign * _evaluate_flat(board, size, current_player, visited, stack), -1
+    else:
+        # Nobody had won before the last move, so only its group can hold a new win
+        if _move_wins(board, size, last_move, opponent, visited, stack):
+            return -sign * _win_score(board), -1
+        if depth == 0:
+            return sign * (_stone_score(board, size, current_player)
+                           - _stone_score(board, size, opponent)), -1
+
+    # Transposition table lookup
+    original_alpha, original_beta = alpha, beta
+    slot = np.int64(board_hash & np.uint64(TT_SIZE - 1))
+    tt_move = -1
+    if tt_depths[slot] >= 0 and tt_keys[slot] == board_hash:
+        tt_move = tt_moves[slot]
+        if tt_depths[slot] >= depth:
+            value = tt_values[slot]
+            if tt_flags[slot] == TT_EXACT:
+                return value, tt_move
+            elif tt_flags[slot] == TT_LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value, tt_move
+
+    best_score = -INF if is_maximizing_player else INF
+    best_move = -1
+
+    # The table's best move first, then the precomputed center-first order
+    for k in range(-1, order.shape[0]):
+        if k < 0:
+            idx = tt_move
+            if idx < 0:
+                continue
+        else:
+            idx = order[k]
+            if idx == tt_move:
+                continue
+        if board[idx] != 0:
+            continue
+
+        board[idx] = current_player
+        eval_score, _ = _alpha_beta_flat(board, size, order, depth - 1, alpha, beta,
+                                         not is_maximizing_player, opponent, idx, visited, stack,
+                                         board_hash ^ keys[current_player, idx], keys, tt)
+        board[idx] = 0  # Undo move
+
+        if is_maximizing_player:
+            if eval_score > best_score:
+                best_score = eval_score
+                best_move = idx
+            alpha = max(alpha, eval_score)
+        else:
+            if eval_score < best_score:
+                best_score = eval_score
+                best_move = idx
+            beta = min(beta, eval_score)
+        if beta <= alpha:
+            break  # Cutoff
+
+    # No valid moves left
+    if best_move == -1:
+        return sign * _evaluate_flat(board, size, current_player, visited, stack), -1
+
+    # Store the result with the kind of bound it represents
+    if best_score <= original_alpha:
+        flag = TT_UPPER
+    elif best_score >= original_beta:
+        flag = TT_LOWER
+    else:
+        flag = TT_EXACT
+    tt_keys[slot] = board_hash
+    tt_values[slot] = best_score
+    tt_depths[slot] = depth
+    tt_flags[slot] = flag
+    tt_moves[slot] = best_move
+
+    return best_score, best_move
+
+
+@njit(cache=True)
+def _new_tt():
+    """Empty transposition table: parallel key, value, depth (-1 = empty), flag and move arrays."""
+    return (np.zeros(TT_SIZE, dtype=np.uint64), np.zeros(TT_SIZE, dtype=np.int32),
+            np.full(TT_SIZE, -1, dtype=np.int8), np.zeros(TT_SIZE, dtype=np.int8),
+            np.zeros(TT_SIZE, dtype=np.int16))
+
+
+@lru_cache(maxsize=None)
+def zobrist_keys(size):
+    """Random 64-bit keys indexed by [player, cell] (row 0 is unused), fixed per size."""
+    rng = np.random.default_rng(size)
+    return rng.integers(0, np.iinfo(np.uint64).max, size=(3, size * size),
+                        dtype=np.uint64, endpoint=True)
+
+
+@njit(cache=True)
+def _hash_flat(board, keys):
+    """Zobrist hash of a flat board."""
+    board_hash = np.uint64(0)
+    for idx in range(board.shape[0]):
+        if board[idx] != 0:
+            board_hash ^= keys[board[idx], idx]
+    return board_hash
+
+
+@lru_cache(maxsize=None)
+def center_order(size):
+    """Cell indices sorted by Manhattan distance to the center (stable, row-major ties)."""
+    center = size // 2
+    rows, cols = np.divmod(np.arange(size * size), size)
+    distance = np.abs(rows - center) + np.abs(cols - center)
+    return np.argsort(distance, kind="stable").astype(np.int64)
+
+
+@njit(cache=True, parallel=True)
+def _root_split_flat(board, size, order, depth, is_maximizing_player, current_player,
+                     first_move, first_score, board_hash, keys, n_chunks):
+    """
+    Searches the root moves other than first_move against the bound set by
+    first_score, with the moves dealt round-robin to n_chunks parallel chunks.
+    Each chunk has its own board copy, scratch arrays and transposition
+    table, and tightens its bound as it finds better moves.
+    Returns (score, index) of the best of these moves, (first_score, -1)
+    if none beats the bound, earliest in order on ties.
+    """
+    moves = np.empty(order.shape[0], dtype=np.int64)
+    n_moves = 0
+    for k in range(order.shape[0]):
+        idx = order[k]
+        if board[idx] == 0 and idx != first_move:
+            moves[n_moves] = k
+            n_moves += 1
+
+    chunk_scores = np.full(n_chunks, first_score, dtype=np.int64)
+    chunk_positions = np.full(n_chunks, -1, dtype=np.int64)
+    for chunk in prange(n_chunks):
+        chunk_board = board.copy()
+        visited = np.zeros(size * size, dtype=np.uint8)
+        stack = np.empty(size * size, dtype=np.int64)
+        tt = _new_tt()
+        bound = first_score
+        for m in range(chunk, n_moves, n_chunks):
+            idx = order[moves[m]]
+            chunk_board[idx] = current_player
+            if is_maximizing_player:
+                alpha, beta = bound, np.int64(INF)
+            else:
+                alpha, beta = np.int64(-INF), bound
+            score, _ = _alpha_beta_flat(chunk_board, size, order, depth - 1, alpha, beta,
+                                        not is_maximizing_player, 3 - current_player, idx,
+                                        visited, stack, board_hash ^ keys[current_player, idx],
+                                        keys, tt)
+            chunk_board[idx] = 0  # Undo move
+            if score > bound if is_maximizing_player else score < bound:
+                bound = score
+                chunk_scores[chunk] = score
+                chunk_positions[chunk] = moves[m]
+
+    best_score = first_score
+    best_position = -1
+    for chunk in range(n_chunks):
+        position = chunk_positions[chunk]
+        if position < 0:
+            continue
+        score = chunk_scores[chunk]
+        improves = score > best_score if is_maximizing_player else score < best_score
+        if best_position < 0 or improves or (score == best_score and position < best_position):
+            best_score = score
+            best_position = position
+    if best_position < 0:
+        return first_score, -1
+    return best_score, order[best_position]
+
+
+def find_move(board, depth, is_maximizing_player, current_player):
+    """
+    Runs the compiled search on a list-of-lists board and returns (row, col) or None.
+    With more than one numba thread, the last depth is split across the root
+    moves by _root_split_flat.
+    """
+    size = len(board)
+    board_flat = np.array(board, dtype=np.int8).ravel()
+    visited = np.zeros(size * size, dtype=np.uint8)
+    stack = np.empty(size * size, dtype=np.int64)
+    keys = zobrist_keys(size)
+    board_hash = np.uint64(_hash_flat(board_flat, keys))
+    order = center_order(size)
+    tt = _new_tt()
+    n_chunks = get_num_threads()
+    last_serial_depth = depth - 1 if n_chunks > 1 and depth > 1 else depth
+    # Iterative deepening: each depth starts from the best moves stored by the last
+    for current_depth in range(1, last_serial_depth + 1):
+        _, idx = _alpha_beta_flat(board_flat, size, order, current_depth,
+                                  -INF, INF, is_maximizing_player, current_player, -1, visited, stack,
+                                  board_hash, keys, tt)
+    if last_serial_depth < depth and idx >= 0:
+        # The shallower search's best move is searched alone for a bound
+        board_flat[idx] = current_player
+        first_score, _ = _alpha_beta_flat(board_flat, size, order, depth - 1, -INF, INF,
+                                          not is_maximizing_player, 3 - current_player, idx,
+                                          visited, stack, board_hash ^ keys[current_player, idx],
+                                          keys, tt)
+        board_flat[idx] = 0  # Undo move
+        _, split_idx = _root_split_flat(board_flat, size, order, depth, is_maximizing_player,
+                                        current_player, idx, first_score, board_hash, keys, n_chunks)
+        if split_idx >= 0:
+            idx = split_idx
+    if idx < 0:
+        return None
+    return divmod(int(idx), size)
@@ -0,0 +1,20 @@
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+import sys
+
+# Build the Cython fallback next to back.py:
+#   python setup_fallback.py build_ext --inplace
+if sys.platform == 'win32':
+    extra_compile_args = ['/O2']
+else:
+    extra_compile_args = ['-O3']
+
+setup(
+    name='hex_fallback',
+    ext_modules=cythonize(
+        [Extension('_hex_fallback', ['_hex_fallback.pyx'],
+                   extra_compile_args=extra_compile_args)],
+        compiler_directives={'language_level': 3},
+    ),
+    description='Cython fallback for the Hex win check and search',
+)
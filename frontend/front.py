@@ -1,13 +1,26 @@
 #!/usr/bin/env python3
 import sys, math, os
+from functools import lru_cache
+from itertools import chain
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                            QPushButton, QLabel, QFormLayout, QMessageBox, QComboBox)
-from PyQt5.QtGui import QPainter, QPolygonF, QColor, QPen, QFont
+from PyQt5.QtGui import QPainter, QPolygonF, QColor, QPen, QFont, QPixmap, QBrush
 from PyQt5.QtCore import Qt, QPointF, QSize, QTimer
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from backend import back
 
+@lru_cache(maxsize=4096)
+def _cached_best_move(cells, size, is_black_turn, depth):
+    """
+    Runs back.find_best_move on a position given as flat row-major bytes.
+    A position seen before (e.g. in every AvA game after the first, which
+    replays the same opening) gets its earlier answer without a new search.
+    """
+    state = back.HexState(size, is_black_turn)
+    state.board = [list(cells[row * size:(row + 1) * size]) for row in range(size)]
+    return back.find_best_move(state, depth=depth)
+
 class HexGame:
     """
     Main game logic class for Hex.
@@ -23,17 +36,11 @@ class HexGame:
         self.move_count = 0
         self.game_over = False
         self.winner = None
-        self.board_states = []
+        self.move_log = []  # (row, col, player, was_swap) per move, for history viewing
         self.current_view_index = -1
         self.viewing_history = False
         self.paused = False
 
-    def to_python_state(self):
-        """Converts current game state to HexState object for AI"""
-        state = back.HexState(self.size, self.is_black_turn)
-        state.board = [row[:] for row in self.board]
-        return state
-
     def make_move(self, row, col):
         """Makes a move at the specified position"""
         if self.paused or self.game_over or self.board[row][col] != 0:
@@ -49,7 +56,7 @@ class HexGame:
             self.first_move = (row, col)
             
         self.is_black_turn = not self.is_black_turn
-        self.board_states.append([row[:] for row in self.board])
+        self.move_log.append((row, col, self.board[row][col], False))
         self.current_view_index = -1
         return True
         
@@ -67,10 +74,20 @@ class HexGame:
         
         self.move_count += 1
         self.is_black_turn = not self.is_black_turn
-        self.board_states.append([row[:] for row in self.board])
+        self.move_log.append((row, col, 2, True))
         self.current_view_index = -1
         return True
 
+    def undo_view_move(self, index):
+        """Takes move number index off the board (for viewing history)"""
+        row, col, _, was_swap = self.move_log[index]
+        self.board[row][col] = 1 if was_swap else 0
+
+    def redo_view_move(self, index):
+        """Puts move number index back on the board (for viewing history)"""
+        row, col, player, _ = self.move_log[index]
+        self.board[row][col] = player
+
     def check_winner(self):
         """Checks if either player has won"""
         if back.check_win(self.board, 1):
@@ -90,7 +107,7 @@ class HexGame:
         self.move_count = 0
         self.game_over = False
         self.winner = None
-        self.board_states = []
+        self.move_log = []
         self.current_view_index = -1
         self.viewing_history = False
         self.paused = False
@@ -108,42 +125,89 @@ class HexBoard(QWidget):
         self.game = game
         self.main_window = main_window
         self.cell_size = 20
+        # Spacing of the hex lattice, used by layout, painting and hit-testing
+        self.hex_width = 2 * self.cell_size
+        self.hex_height = 2 * self.cell_size * math.sin(math.pi/3)
+        
+        # Vertex offsets of a hexagon from its center, computed once
+        self._hex_offsets = [(self.cell_size * math.cos(math.pi / 3 * i),
+                              self.cell_size * math.sin(math.pi / 3 * i)) for i in range(6)]
+        self._hex_template = QPolygonF([QPointF(dx, dy) for dx, dy in self._hex_offsets])
+        
+        # Cell centers for the current widget and board size (see cell_centers)
+        self._centers = None
+        self._centers_key = None
+        
+        # Stone fills indexed by player number
+        self._stone_brushes = (None, QBrush(QColor("blue")), QBrush(QColor("red")))
+        
+        # Pre-rendered static board layers (see board_layers)
+        self._layers = None
+        self._layers_key = None
         
         width = self.game.size * 2 * self.cell_size + (self.game.size - 1) * self.cell_size
-        height = self.game.size * 2 * self.cell_size * math.sin(math.pi/3) + 40
+        height = self.game.size * self.hex_height + 40
         
         self.setMinimumSize(int(width), int(height))
     
     def paintEvent(self, event):
+        background, overlay = self.board_layers()
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, background)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        widget_center_x = self.width() / 2
-        widget_center_y = self.height() / 2 + 12
-        
-        hex_width = 2 * self.cell_size
-        hex_height = 2 * self.cell_size * math.sin(math.pi/3)
-        
-        # Draw board hexagons
-        for row in range(self.game.size):
-            for col in range(self.game.size):
-                x = widget_center_x + (col - row) * (hex_width * 0.75)
-                y = widget_center_y + (col + row - self.game.size + 1) * (hex_height * 0.5)
-                
-                hexagon = self.create_hexagon(x, y)
-                
-                if self.game.board[row][col] == 1:
-                    painter.setBrush(QColor("blue"))
-                elif self.game.board[row][col] == 2:
-                    painter.setBrush(QColor("red"))
-                else:
-                    painter.setBrush(QColor("lightgray"))
-
-                painter.setPen(Qt.black)
-                painter.drawPolygon(hexagon)
-        
-        self.draw_borders(painter, widget_center_x, widget_center_y, hex_width, hex_height)
-        self.draw_labels(painter, widget_center_x, widget_center_y, hex_width, hex_height)
+        # Draw only the occupied hexagons over the empty board
+        centers = self.cell_centers()
+        painter.setPen(Qt.black)
+        for row, cells in enumerate(self.game.board):
+            for col, cell in enumerate(cells):
+                if cell:
+                    painter.setBrush(self._stone_brushes[cell])
+                    painter.drawPolygon(self.create_hexagon(*centers[row][col]))
+        
+        painter.drawPixmap(0, 0, overlay)
+
+    def board_layers(self):
+        """
+        Returns the static parts of the board as two transparent pixmaps: the
+        empty hexagons drawn below the stones, and the borders and labels
+        drawn above them. Rebuilt only when the widget or board size changes.
+        """
+        ratio = self.devicePixelRatioF()
+        key = (self.width(), self.height(), self.game.size, ratio)
+        if key != self._layers_key:
+            widget_center_x = self.width() / 2
+            widget_center_y = self.height() / 2 + 12
+            
+            hex_width = self.hex_width
+            hex_height = self.hex_height
+            
+            layers = []
+            for _ in range(2):
+                pixmap = QPixmap(self.size() * ratio)
+                pixmap.setDevicePixelRatio(ratio)
+                pixmap.fill(Qt.transparent)
+                layers.append(pixmap)
+            background, overlay = layers
+            
+            painter = QPainter(background)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.black)
+            painter.setBrush(QColor("lightgray"))
+            for row_centers in self.cell_centers():
+                for x, y in row_centers:
+                    painter.drawPolygon(self.create_hexagon(x, y))
+            painter.end()
+            
+            painter = QPainter(overlay)
+            painter.setRenderHint(QPainter.Antialiasing)
+            self.draw_borders(painter, widget_center_x, widget_center_y, hex_width, hex_height)
+            self.draw_labels(painter, widget_center_x, widget_center_y, hex_width, hex_height)
+            painter.end()
+            
+            self._layers = (background, overlay)
+            self._layers_key = key
+        return self._layers
 
     def draw_borders(self, painter, cx, cy, hex_width, hex_height):
         size = self.game.size
@@ -190,23 +254,27 @@ class HexBoard(QWidget):
         y = cy + (col + row - self.game.size + 1) * (hex_height * 0.5)
         return x, y
 
+    def cell_centers(self):
+        """
+        Returns the (x, y) center of every cell as a list of rows, recomputed
+        only when the widget or board size has changed.
+        """
+        key = (self.width(), self.height(), self.game.size)
+        if key != self._centers_key:
+            cx = self.width() / 2
+            cy = self.height() / 2 + 12
+            hex_width = self.hex_width
+            hex_height = self.hex_height
+            self._centers = [[self.get_hex_position(row, col, cx, cy, hex_width, hex_height)
+                              for col in range(self.game.size)] for row in range(self.game.size)]
+            self._centers_key = key
+        return self._centers
+
     def create_hexagon(self, x, y):
-        hexagon = QPolygonF()
-        for i in range(6):
-            angle_rad = math.pi / 3 * i
-            px = x + self.cell_size * math.cos(angle_rad)
-            py = y + self.cell_size * math.sin(angle_rad)
-            hexagon.append(QPointF(px, py))
-        return hexagon
+        return self._hex_template.translated(x, y)
 
     def get_hex_vertices(self, x, y):
-        vertices = []
-        for i in range(6):
-            angle_rad = math.pi / 3 * i
-            px = x + self.cell_size * math.cos(angle_rad)
-            py = y + self.cell_size * math.sin(angle_rad)
-            vertices.append(QPointF(px, py))
-        return vertices
+        return [QPointF(x + dx, y + dy) for dx, dy in self._hex_offsets]
 
     def mousePressEvent(self, event):
         if self.game.paused:
@@ -231,13 +299,23 @@ class HexBoard(QWidget):
         closest_row, closest_col = -1, -1
         min_distance = float("inf")
         
-        hex_width = 2 * self.cell_size
-        hex_height = 2 * self.cell_size * math.sin(math.pi/3)
-        
-        for row in range(self.game.size):
-            for col in range(self.game.size):
-                hex_x, hex_y = self.get_hex_position(row, col, widget_center_x, widget_center_y, 
-                                                    hex_width, hex_height)
+        hex_width = self.hex_width
+        hex_height = self.hex_height
+        
+        # Invert get_hex_position to fractional (row, col); the cell centers
+        # form a triangular lattice, so the nearest one is a corner of the
+        # unit cell around that point
+        col_minus_row = (x - widget_center_x) / (hex_width * 0.75)
+        col_plus_row = (y - widget_center_y) / (hex_height * 0.5) + self.game.size - 1
+        base_row = math.floor((col_plus_row - col_minus_row) / 2)
+        base_col = math.floor((col_plus_row + col_minus_row) / 2)
+        
+        centers = self.cell_centers()
+        for row in (base_row, base_row + 1):
+            for col in (base_col, base_col + 1):
+                if not (0 <= row < self.game.size and 0 <= col < self.game.size):
+                    continue
+                hex_x, hex_y = centers[row][col]
                 distance = (x - hex_x) ** 2 + (y - hex_y) ** 2
                 
                 if distance < min_distance and distance < (self.cell_size ** 2 * 1.5):
@@ -315,8 +393,8 @@ class HexBoard(QWidget):
                     return
 
         # Get best move from AI
-        current_state = self.game.to_python_state()
-        best_move = back.find_best_move(current_state, depth=ai_depth)
+        cells = bytes(chain.from_iterable(self.game.board))
+        best_move = _cached_best_move(cells, self.game.size, self.game.is_black_turn, ai_depth)
 
         if best_move != (-1, -1):
             if self.game.make_move(best_move[0], best_move[1]):
@@ -497,30 +575,31 @@ class HexWindow(QMainWindow):
 
     def show_previous_move(self):
         """Shows the previous move in history"""
-        if not self.game.board_states:
+        if not self.game.move_log:
             return
             
         if self.game.current_view_index == -1:
-            self.game.current_view_index = len(self.game.board_states) - 1
+            self.game.current_view_index = len(self.game.move_log) - 1
             
         if self.game.current_view_index > 0:
+            self.game.undo_view_move(self.game.current_view_index)
             self.game.current_view_index -= 1
-            self.game.board = [row[:] for row in self.game.board_states[self.game.current_view_index]]
             self.board_widget.update()
             self.game.viewing_history = True
             self.update_navigation_buttons()
             
     def show_next_move(self):
         """Shows the next move in history"""
-        if not self.game.board_states:
+        if not self.game.move_log:
             return
             
-        if self.game.current_view_index < len(self.game.board_states) - 1:
+        # Already at the latest move unless viewing history
+        if 0 <= self.game.current_view_index < len(self.game.move_log) - 1:
             self.game.current_view_index += 1
-            self.game.board = [row[:] for row in self.game.board_states[self.game.current_view_index]]
+            self.game.redo_view_move(self.game.current_view_index)
             self.board_widget.update()
             
-            if self.game.current_view_index == len(self.game.board_states) - 1:
+            if self.game.current_view_index == len(self.game.move_log) - 1:
                 self.game.viewing_history = False
                 self.game.current_view_index = -1
             
@@ -528,7 +607,7 @@ class HexWindow(QMainWindow):
 
     def update_navigation_buttons(self):
         """Updates the state of move navigation buttons"""
-        if not self.game.board_states:
+        if not self.game.move_log:
             self.prev_move_button.setEnabled(False)
             self.next_move_button.setEnabled(False)
             self.view_label.setText("Current view: No moves yet")
@@ -540,7 +619,7 @@ class HexWindow(QMainWindow):
             self.view_label.setText("Current view: Latest move")
         else:
             self.prev_move_button.setEnabled(self.game.current_view_index > 0)
-            self.next_move_button.setEnabled(self.game.current_view_index < len(self.game.board_states) - 1)
+            self.next_move_button.setEnabled(self.game.current_view_index < len(self.game.move_log) - 1)
             self.view_label.setText(f"Current view: Move #{self.game.current_view_index + 1}")
 
     def update_turn_label(self):
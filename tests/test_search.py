@@ -0,0 +1,130 @@
+import os, sys, unittest
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from backend import back
+
+try:
+    import hex_numba
+except ImportError:
+    hex_numba = None
+
+try:
+    import _hex_fallback
+except ImportError:
+    _hex_fallback = None
+
+SIZE = 7
+
+def position(player, own, other):
+    """
+    Builds a SIZE x SIZE board from cells given for Blue (player 1); for Red
+    the board is transposed and the colours swapped, so the same cells make
+    the same threats along Red's left-right direction.
+    """
+    board = [[0] * SIZE for _ in range(SIZE)]
+    for cells, stone in ((own, player), (other, 3 - player)):
+        for r, c in cells:
+            if player == 1:
+                board[r][c] = stone
+            else:
+                board[c][r] = stone
+    return board
+
+def cell(player, r, c):
+    return (r, c) if player == 1 else (c, r)
+
+# player's stones run from their start edge to the cell before the goal
+# edge, so they win at (6, 2) or (6, 3)
+WIN_OWN = [(r, 3) for r in range(6)]
+WIN_OTHER = [(1, 0), (2, 0), (3, 0), (4, 0), (5, 0), (6, 6)]
+
+# The opponent's stones run along row 3 up to column 5, and (2, 6) is
+# taken, so (3, 6) is the only cell where they win next move
+THREAT_OWN = [(2, 6), (0, 0), (6, 0)]
+THREAT_OTHER = [(3, c) for c in range(6)]
+
+class TacticsTestCase(unittest.TestCase):
+    def assertWins(self, board, player, move):
+        self.assertIsNotNone(move)
+        board = [row[:] for row in board]
+        self.assertEqual(board[move[0]][move[1]], 0)
+        board[move[0]][move[1]] = player
+        self.assertTrue(back.check_win(board, player), move)
+
+class SearchTacticsTest(TacticsTestCase):
+
+    def test_iterative_deepening_takes_immediate_win(self):
+        for player in (1, 2):
+            for depth in (1, 2, 3):
+                with self.subTest(player=player, depth=depth):
+                    board = position(player, WIN_OWN, WIN_OTHER)
+                    self.assertWins(board, player, back.iterative_deepening(board, depth, player))
+
+    def test_iterative_deepening_blocks_single_threat(self):
+        for player in (1, 2):
+            for depth in (1, 2, 3):
+                with self.subTest(player=player, depth=depth):
+                    board = position(player, THREAT_OWN, THREAT_OTHER)
+                    self.assertEqual(back.iterative_deepening(board, depth, player),
+                                     cell(player, 3, 6))
+
+    def test_leaf_scores_one_move_tactics(self):
+        # A depth-0 node is a win if the side to move has a winning cell and a
+        # loss if the side waiting has two; with one threat it is searched on
+        for player in (1, 2):
+            with self.subTest(player=player):
+                board = position(player, WIN_OWN, WIN_OTHER)
+                score, _ = back.alpha_beta(board, 0, back.NEG_INF, back.POS_INF, player,
+                                           connectivity=back.HexConnectivity(board))
+                self.assertGreater(score, 900)
+                score, _ = back.alpha_beta(board, 0, back.NEG_INF, back.POS_INF, 3 - player,
+                                           connectivity=back.HexConnectivity(board))
+                self.assertLess(score, -900)
+                board = position(player, THREAT_OWN, THREAT_OTHER)
+                score, move = back.alpha_beta(board, 0, back.NEG_INF, back.POS_INF, player,
+                                              connectivity=back.HexConnectivity(board))
+                self.assertEqual(move, cell(player, 3, 6))
+
+    def test_find_best_move_takes_immediate_win(self):
+        saved = back.USE_CPP_IMPLEMENTATION, back.USE_NUMBA_IMPLEMENTATION, back.USE_CYTHON_IMPLEMENTATION
+        back.USE_CPP_IMPLEMENTATION = back.USE_NUMBA_IMPLEMENTATION = back.USE_CYTHON_IMPLEMENTATION = False
+        try:
+            for player in (1, 2):
+                with self.subTest(player=player):
+                    state = back.HexState(SIZE, player == 1)
+                    state.board = position(player, WIN_OWN, WIN_OTHER)
+                    self.assertWins(state.board, player, back.find_best_move(state, depth=3))
+        finally:
+            back.USE_CPP_IMPLEMENTATION, back.USE_NUMBA_IMPLEMENTATION, back.USE_CYTHON_IMPLEMENTATION = saved
+
+class FallbackTacticsTests:
+    """Tactics checks shared by the compiled fallbacks; subclasses define search."""
+
+    def test_takes_immediate_win(self):
+        for player in (1, 2):
+            for depth in (1, 2, 3):
+                with self.subTest(player=player, depth=depth):
+                    board = position(player, WIN_OWN, WIN_OTHER)
+                    self.assertWins(board, player, self.search(board, depth, player))
+
+    def test_blocks_single_threat(self):
+        # No threat extension here, so the reply is only seen from depth 2
+        for player in (1, 2):
+            for depth in (2, 3):
+                with self.subTest(player=player, depth=depth):
+                    board = position(player, THREAT_OWN, THREAT_OTHER)
+                    self.assertEqual(self.search(board, depth, player), cell(player, 3, 6))
+
+@unittest.skipIf(hex_numba is None, "numba is not installed")
+class NumbaTacticsTest(FallbackTacticsTests, TacticsTestCase):
+    def search(self, board, depth, player):
+        return hex_numba.find_move(board, depth, player == 1, player)
+
+@unittest.skipIf(_hex_fallback is None, "the Cython fallback is not built")
+class CythonTacticsTest(FallbackTacticsTests, TacticsTestCase):
+    def search(self, board, depth, player):
+        cells = bytes(cell for row in board for cell in row)
+        return _hex_fallback.find_move_c(cells, len(board), depth, player == 1, player)
+
+if __name__ == "__main__":
+    unittest.main()